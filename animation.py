@@ -0,0 +1,119 @@
+# 매개변수(k, a 등)를 바꿔 가며 그래프를 재생하는 브라우저 쪽 애니메이션
+# 모든 프레임을 (매개변수 수 × x 개수) 배열로 한 번에 계산해서 한 번만 보내고,
+# 재생은 브라우저(canvas)에서 처리하므로 프레임마다 서버에 다시 요청하지 않습니다.
+import base64
+import json
+
+import numpy as np
+
+# 정수 양자화에서 "선을 끊는 자리"(NaN, 무한대)를 나타내는 값
+BREAK = -32768
+
+
+# f(매개변수[:, None], x[None, :]) 한 번 호출로 전체 프레임 계산
+def sweep(f, params, x):
+    params = np.asarray(params, dtype=float)[:, None]
+    x = np.asarray(x, dtype=float)[None, :]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        frames = np.asarray(f(params, x), dtype=float)
+    return np.broadcast_to(frames, (params.shape[0], x.shape[1]))
+
+
+# 프레임을 int16으로 양자화해서 base64 문자열로 (float64의 1/4 크기)
+# 화면 위아래로 창 높이의 절반만큼 여유를 두고 자르므로, 잘린 선도 화면 밖에서 끝남
+def pack_frames(frames, y_min, y_max):
+    margin = (y_max - y_min) / 2
+    lo, hi = y_min - margin, y_max + margin
+    finite = np.isfinite(frames)
+    scaled = (np.clip(np.where(finite, frames, lo), lo, hi) - lo) / (hi - lo) * 65534 - 32767
+    q = np.where(finite, np.round(scaled), BREAK).astype("<i2")
+    return lo, hi, base64.b64encode(q.tobytes()).decode("ascii")
+
+
+def player_html(x, params, frames, label, y_range, digits=1, fps=20, height=420):
+    """프레임 묶음과 재생기를 담은 HTML 한 덩어리를 돌려줍니다 (st.iframe용).
+
+    label의 {}에는 현재 매개변수 값이 들어갑니다. 예: "y = {}/x"
+    """
+    y_min, y_max = y_range
+    lo, hi, data = pack_frames(frames, y_min, y_max)
+    config = {
+        "x": np.round(np.asarray(x, dtype=float), 5).tolist(),
+        "params": np.round(np.asarray(params, dtype=float), digits).tolist(),
+        "lo": lo, "hi": hi, "data": data,
+        "x_min": float(x[0]), "x_max": float(x[-1]), "y_min": y_min, "y_max": y_max,
+        "label": label, "digits": digits, "fps": fps, "height": height,
+    }
+    return _PLAYER.replace("__CONFIG__", json.dumps(config))
+
+
+_PLAYER = """
+<div style="font-family: sans-serif">
+  <canvas id="cv" style="width: 100%; background: #fff; border: 1px solid #ddd; border-radius: 6px"></canvas>
+  <div style="display: flex; gap: 8px; align-items: center; margin-top: 6px">
+    <button id="play" style="width: 3em">⏸</button>
+    <input id="pos" type="range" min="0" step="1" style="flex: 1">
+    <span id="label" style="min-width: 8em; text-align: right"></span>
+  </div>
+</div>
+<script>
+const C = __CONFIG__;
+const raw = Uint8Array.from(atob(C.data), c => c.charCodeAt(0));
+const q = new Int16Array(raw.buffer);
+const nx = C.x.length, nf = C.params.length, step = (C.hi - C.lo) / 65534;
+const canvas = document.getElementById("cv"), ctx = canvas.getContext("2d");
+const pos = document.getElementById("pos"), label = document.getElementById("label");
+const play = document.getElementById("play");
+let frame = 0, playing = true, last = 0;
+pos.max = nf - 1;
+
+const sx = x => (x - C.x_min) / (C.x_max - C.x_min) * canvas.width;
+const sy = y => (C.y_max - y) / (C.y_max - C.y_min) * canvas.height;
+
+function draw() {
+  const r = window.devicePixelRatio || 1;
+  ctx.clearRect(0, 0, canvas.width, canvas.height);
+  ctx.strokeStyle = "#999"; ctx.lineWidth = r; ctx.setLineDash([4 * r, 4 * r]);
+  ctx.beginPath();
+  ctx.moveTo(sx(0), 0); ctx.lineTo(sx(0), canvas.height);
+  ctx.moveTo(0, sy(0)); ctx.lineTo(canvas.width, sy(0));
+  ctx.stroke(); ctx.setLineDash([]);
+  ctx.strokeStyle = "#1f77b4"; ctx.lineWidth = 2.5 * r;
+  ctx.beginPath();
+  let pen = false;
+  for (let i = 0, base = frame * nx; i < nx; i++) {
+    const v = q[base + i];
+    if (v === -32768) { pen = false; continue; }
+    const px = sx(C.x[i]), py = sy(C.lo + (v + 32767) * step);
+    if (pen) ctx.lineTo(px, py); else ctx.moveTo(px, py);
+    pen = true;
+  }
+  ctx.stroke();
+  label.textContent = C.label.replace("{}", C.params[frame].toFixed(C.digits));
+  pos.value = frame;
+}
+
+function resize() {
+  const r = window.devicePixelRatio || 1;
+  canvas.style.height = C.height + "px";
+  canvas.width = canvas.clientWidth * r;
+  canvas.height = C.height * r;
+  draw();
+}
+
+function tick(t) {
+  if (playing && t - last >= 1000 / C.fps) {
+    frame = (frame + 1) % nf;
+    last = t;
+    draw();
+  }
+  requestAnimationFrame(tick);
+}
+
+play.onclick = () => { playing = !playing; play.textContent = playing ? "⏸" : "▶"; };
+pos.oninput = () => { frame = +pos.value; playing = false; play.textContent = "▶"; draw(); };
+window.addEventListener("resize", resize);
+resize();
+requestAnimationFrame(tick);
+</script>
+"""
@@ -0,0 +1,283 @@
+# 페이지별 재실행(rerun) 성능 측정
+# Streamlit의 앱 테스트 도구(AppTest)로 브라우저 없이 main.py와 pages/의 각 페이지를 실행하면서
+# 위젯 값(k, x 범위, a, 가족 보기, 세트 수, 포함/제외 숫자 등)을 바꿔 가며
+# 재실행 시간(p50/p95), 최대 메모리, 브라우저로 보내는 출력 크기를 잽니다.
+#
+#   python bench_pages.py                       모든 페이지 측정 → bench_results.json, 기준값과 비교
+#   python bench_pages.py pages/유리함수.py     일부 페이지만
+#   python bench_pages.py --save-baseline       이번 결과를 기준값(bench_baseline.json)으로 저장
+#
+# 기준값보다 tolerance배 넘게 나빠진 항목이 있으면 종료 코드 1 (닫히지 않은 그림, 히스토리 전체를
+# 매번 내보내는 코드처럼 재실행마다 쌓이는 문제는 유지 메모리·출력 크기·p95에서 숫자로 드러납니다.)
+import argparse
+import gc
+import glob
+import json
+import logging
+import os
+import platform
+import sys
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+from unittest.mock import patch
+
+import numpy as np
+import streamlit as st
+from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+from streamlit.testing.v1 import AppTest, app_test
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+RESULTS_PATH = os.path.join(BASE_DIR, "bench_results.json")
+BASELINE_PATH = os.path.join(BASE_DIR, "bench_baseline.json")
+
+# 비교할 항목과, 이보다 작은 값끼리는 잡음으로 보고 비교하지 않는 하한
+METRICS = {"p50_ms": 5.0, "p95_ms": 5.0, "peak_kb": 1024.0, "retained_kb": 1024.0, "payload_kb": 16.0}
+
+# 재실행 한 번 = 위젯 값 묶음 하나. (위젯 종류, 라벨 앞부분) → 값, "click"은 값을 바꾼 뒤 누를 버튼
+RATIONAL_STEPS = (
+    [{("slider", "k 값"): k, ("slider", "x 범위"): x} for x in (5.0, 10.0, 30.0, 50.0)
+     for k in (-10.0, -2.5, 0.1, 2.0, 7.3)]
+    + [{("checkbox", "대표 점"): False, ("checkbox", "대표 값 표"): False},
+       {("checkbox", "▶️ k 애니메이션"): True},
+       {("checkbox", "▶️ k 애니메이션"): False, ("checkbox", "🔍 확대/이동"): True},
+       {"click": "➕"}, {"click": "➕"}, {"click": "➡️"}, {("slider", "k 값"): -4.0}, {"click": "↺"},
+       {("checkbox", "🔍 확대/이동"): False, ("checkbox", "대표 점"): True, ("checkbox", "대표 값 표"): True}]
+)
+RATIONAL_K_STEPS = [{("slider", "k 값"): k / 2} for k in range(-10, 11)]
+QUADRATIC_STEPS = (
+    [{("slider", "a 값"): a, ("checkbox", "여러 a 값"): family}
+     for family in (False, True) for a in (-5.0, -2.3, -0.5, 0.5, 1.0, 3.7, 5.0)]
+    + [{("checkbox", "가족을 촘촘하게"): True}, {("slider", "a 값"): -1.2},
+       {("checkbox", "가족을 촘촘하게"): False, ("checkbox", "여러 a 값"): False},
+       {("checkbox", "▶️ a 애니메이션"): True}, {("checkbox", "▶️ a 애니메이션"): False}]
+)
+LOTTO_STEPS = (
+    [{("number_input", "생성할 세트 수"): n, ("text_input", "강제로 포함"): inc,
+      ("text_input", "제외할 숫자"): exc, "click": "✨"}
+     for n in (1, 10, 50) for inc, exc in (("", ""), ("3, 7", ""), ("", "1, 2, 3, 44, 45"), ("7", "8, 9"))]
+    + [{("checkbox", "히스토리와 겹치지"): True, "click": "✨"},
+       {("checkbox", "히스토리와 겹치지"): False, ("checkbox", "대량 생성"): True,
+        ("number_input", "생성할 세트 수"): 10_000, "click": "✨"},
+       {("number_input", "생성할 세트 수"): 100_000, "click": "✨"},
+       {("checkbox", "대량 생성"): False, ("number_input", "생성할 세트 수"): 5,
+        ("text_input", "강제로 포함"): "", ("text_input", "제외할 숫자"): ""}]
+)
+
+# 페이지가 띄우는 캐시 미리 채우기 스레드 (plot_utils.FigureCache.warm, WarmCache, warmup.start_warm_up)
+WARM_THREADS = {"figure-cache-warm", "warm-cache", "warm-up"}
+
+SWEEPS = {
+    "main.py": [{}],
+    "pages/유리함수.py": RATIONAL_STEPS,
+    "pages/유리함수 그래프.py": RATIONAL_STEPS,
+    "pages/유리함수ㄱ.py": RATIONAL_K_STEPS,
+    "pages/유리함수ㅡ.py": RATIONAL_K_STEPS,
+    "pages/이차함수표준형그래프.py": QUADRATIC_STEPS,
+    "pages/로또번호추첨기.py": LOTTO_STEPS,
+}
+
+_media_bytes = [0]  # 이번 실행에서 새로 올라간 미디어(이미지, 다운로드 파일) 바이트 수
+
+
+# AppTest가 실행마다 새로 만드는 미디어 저장소를, 올라온 바이트 수를 세는 저장소로 바꿔 끼움
+class _CountingStorage(MemoryMediaFileStorage):
+    def load_and_get_id(self, path_or_data, mimetype, kind, filename=None):
+        before = len(self._files_by_id)
+        file_id = super().load_and_get_id(path_or_data, mimetype, kind, filename)
+        if len(self._files_by_id) > before:
+            _media_bytes[0] += len(self._files_by_id[file_id].content)
+        return file_id
+
+
+# 화면 요소(proto) 크기 합계
+def _tree_bytes(node):
+    proto = getattr(node, "proto", None)
+    size = proto.ByteSize() if hasattr(proto, "ByteSize") else 0
+    children = getattr(node, "children", None) or {}
+    return size + sum(_tree_bytes(child) for child in children.values())
+
+
+def _find(at, kind, label):
+    for widget in at.get(kind):
+        if widget.label.startswith(label):
+            return widget
+    raise LookupError(f"{kind} '{label}' 위젯을 찾을 수 없습니다")
+
+
+def _run(at):
+    _media_bytes[0] = 0
+    t = time.perf_counter()
+    at.run()
+    seconds = time.perf_counter() - t
+    if at.exception:
+        raise RuntimeError(f"{at.exception[0].message}")
+    return seconds, _tree_bytes(at._tree) + _media_bytes[0]
+
+
+def _apply(at, step):
+    for target, value in step.items():
+        if target != "click":
+            _find(at, *target).set_value(value)
+    if "click" in step:
+        _find(at, "button", step["click"]).click()
+
+
+# 한 바퀴: 단계마다 위젯 값을 바꾸고 한 번 재실행
+def _sweep(at, steps, memory=False):
+    times, payloads, peaks = [], [], []
+    for step in steps:
+        _apply(at, step)
+        if memory:
+            start = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        seconds, payload = _run(at)
+        times.append(seconds)
+        payloads.append(payload)
+        if memory:
+            peaks.append(tracemalloc.get_traced_memory()[1] - start)
+    return times, payloads, peaks
+
+
+def bench_page(path, repeat=3, timeout=120):
+    """한 페이지를 측정해 결과 dict를 돌려줍니다.
+
+    st.cache_data / st.cache_resource를 비운 상태에서 시작하므로 다른 페이지가 채운 캐시의 덕을 보지 않습니다.
+    처음 실행(import, 캐시 채우기)과 미리 채우기 스레드를 기다린 시간은 따로 기록하고,
+    위젯 값 묶음을 repeat바퀴 돌며 시간과 출력 크기를 잰 뒤, tracemalloc을 켠 상태로 한 바퀴 더 돌아
+    최대 메모리와 (한 바퀴 뒤에도 남아 있는) 유지 메모리를 잽니다.
+    """
+    steps = SWEEPS.get(path, [{}])
+    st.cache_data.clear()
+    st.cache_resource.clear()
+    at = AppTest.from_file(os.path.join(BASE_DIR, path), default_timeout=timeout)
+    first, _ = _run(at)
+    # 미리 채우기가 끝난 뒤(실제 서버에서 두 번째 방문자부터 보는 상태)를 측정
+    t = time.perf_counter()
+    for thread in threading.enumerate():
+        if thread.name in WARM_THREADS:
+            thread.join()
+    warm = time.perf_counter() - t
+    times, payloads = [], []
+    for _ in range(repeat):
+        t, p, _ = _sweep(at, steps)
+        times += t
+        payloads += p
+
+    # 순환 참조 쓰레기가 언제 수거되는지에 따라 값이 흔들리지 않게 재기 전후로 한 번씩 수거
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    _, _, peaks = _sweep(at, steps, memory=True)
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    times_ms = np.array(times) * 1000
+    return {
+        "runs": len(times),
+        "first_run_ms": round(first * 1000, 1),
+        "warm_wait_ms": round(warm * 1000, 1),
+        "p50_ms": round(float(np.percentile(times_ms, 50)), 1),
+        "p95_ms": round(float(np.percentile(times_ms, 95)), 1),
+        "max_ms": round(float(times_ms.max()), 1),
+        "peak_kb": round(max(peaks) / 1024, 1),
+        "retained_kb": round(retained / 1024, 1),
+        "payload_kb": round(float(np.percentile(payloads, 50)) / 1024, 1),
+        "payload_max_kb": round(max(payloads) / 1024, 1),
+    }
+
+
+def compare(results, baseline, tolerance):
+    """기준값보다 tolerance배 넘게 커진 (페이지, 항목, 기준값, 이번 값) 목록을 돌려줍니다."""
+    regressions = []
+    for page, now in results["pages"].items():
+        base = baseline.get("pages", {}).get(page)
+        if base is None:
+            continue
+        for metric, floor in METRICS.items():
+            old, new = base.get(metric), now.get(metric)
+            if old is None or new is None or max(old, new) < floor:
+                continue
+            if new > max(old, floor) * tolerance:
+                regressions.append((page, metric, old, new))
+    return regressions
+
+
+def print_table(results, baseline=None):
+    header = f"{'페이지':<22} {'실행':>4} {'처음':>8} {'p50':>8} {'p95':>8} {'최대 메모리':>10} {'유지':>8} {'출력':>8}"
+    print(header)
+    for page, r in results["pages"].items():
+        print(f"{page:<22} {r['runs']:>5} {r['first_run_ms']:>7.0f}ms {r['p50_ms']:>6.1f}ms {r['p95_ms']:>6.1f}ms "
+              f"{r['peak_kb'] / 1024:>10.1f}MB {r['retained_kb']:>6.0f}KB {r['payload_kb']:>6.1f}KB")
+        base = (baseline or {}).get("pages", {}).get(page)
+        if base:
+            print(f"{'  (기준값)':<22} {base['runs']:>5} {base['first_run_ms']:>7.0f}ms {base['p50_ms']:>6.1f}ms "
+                  f"{base['p95_ms']:>6.1f}ms {base['peak_kb'] / 1024:>10.1f}MB {base['retained_kb']:>6.0f}KB "
+                  f"{base['payload_kb']:>6.1f}KB")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="페이지별 재실행 시간·메모리·출력 크기 측정")
+    parser.add_argument("pages", nargs="*", help="측정할 페이지 (기본: main.py와 pages/의 모든 페이지)")
+    parser.add_argument("--repeat", type=int, default=3, help="위젯 값 묶음을 몇 바퀴 돌지")
+    parser.add_argument("-o", "--output", default=RESULTS_PATH, help="결과 JSON 파일")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="비교할 기준값 JSON 파일")
+    parser.add_argument("--save-baseline", action="store_true", help="이번 결과를 기준값 파일로 저장")
+    parser.add_argument("--tolerance", type=float, default=1.5, help="기준값의 몇 배부터 성능 저하로 볼지")
+    args = parser.parse_args(argv)
+
+    # 브라우저 세션 없이 실행해서 나오는 경고("missing ScriptRunContext", "No runtime found")는 끔
+    for name in ("streamlit.runtime.scriptrunner_utils.script_run_context",
+                 "streamlit.runtime.caching.cache_data_api"):
+        logging.getLogger(name).disabled = True
+    os.chdir(BASE_DIR)
+    sys.path.insert(0, BASE_DIR)
+    pages = args.pages or ["main.py"] + sorted(glob.glob("pages/*.py"))
+    pages = [os.path.relpath(os.path.abspath(p), BASE_DIR) for p in pages]
+
+    # 무거운 모듈을 먼저 불러 두어, 페이지 순서와 상관없이 처음 실행 시간이 그 페이지의 몫만 되게 함
+    from warmup import warm_up
+
+    warm_up()
+    results = {
+        "meta": {
+            "date": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "streamlit": st.__version__,
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+        },
+        "pages": {},
+    }
+    with patch.object(app_test, "MemoryMediaFileStorage", _CountingStorage):
+        for page in pages:
+            print(f"측정 중: {page}", file=sys.stderr)
+            results["pages"][page] = bench_page(page, repeat=args.repeat)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, ensure_ascii=False, indent=2)
+
+    baseline = None
+    if not args.save_baseline and os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    print_table(results, baseline)
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n기준값 저장: {args.baseline}")
+        return 0
+    if baseline is None:
+        return 0
+    regressions = compare(results, baseline, args.tolerance)
+    for page, metric, old, new in regressions:
+        print(f"⚠️ {page} {metric}: {old} → {new}")
+    if not regressions:
+        print(f"\n기준값 대비 {args.tolerance}배 넘게 나빠진 항목 없음")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
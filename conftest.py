@@ -0,0 +1,2 @@
+# pytest가 저장소 루트의 모듈(sampling, plot_utils, lotto_engine 등)을 찾을 수 있게 하는 파일
+# (루트에 conftest.py가 있으면 pytest가 이 폴더를 import 경로에 넣어 줌)
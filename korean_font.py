@@ -0,0 +1,48 @@
+# 그래프 한글 글꼴 설정
+# 저장소에 함께 넣어 둔 나눔고딕(fonts/NanumGothic.ttf, SIL OFL 1.1 — fonts/OFL.txt)을
+# 서버 프로세스에서 한 번만 등록하고, 모든 페이지의 그림이 같은 설정을 씁니다.
+# (글꼴이 없으면 한글이 □로 나오고, 그릴 때마다 글꼴을 찾느라 느려지며 경고가 쌓입니다.)
+import os
+import threading
+
+from matplotlib import font_manager, rcParams
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+FONT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fonts")
+FONT_PATH = os.environ.get("KOREAN_FONT_PATH", os.path.join(FONT_DIR, "NanumGothic.ttf"))
+
+# 번들 글꼴 파일이 없을 때 찾아볼 시스템 글꼴
+FALLBACK_FAMILIES = ["Malgun Gothic", "AppleGothic", "NanumGothic", "Noto Sans CJK KR", "Noto Sans KR"]
+
+_lock = threading.Lock()
+_family = None
+
+
+def _find_family():
+    if os.path.exists(FONT_PATH):
+        font_manager.fontManager.addfont(FONT_PATH)
+        return font_manager.FontProperties(fname=FONT_PATH).get_name()
+    installed = {f.name for f in font_manager.fontManager.ttflist}
+    return next((name for name in FALLBACK_FAMILIES if name in installed), None)
+
+
+def setup_korean_font():
+    """한글 글꼴을 등록해 기본 글꼴로 지정하고 글꼴 이름을 돌려줍니다 (처음 한 번만 실제로 실행).
+
+    한글 글꼴이 없는 글자(예: 유니코드 빼기 기호)는 DejaVu Sans로 이어서 그립니다.
+    """
+    global _family
+    with _lock:
+        if _family is not None:
+            return _family or None
+        family = _find_family()
+        if family is not None:
+            rcParams["font.family"] = [family, "DejaVu Sans"]
+            # 글꼴 파일 탐색 결과와 글리프를 미리 캐시해 두어 첫 그림이 느려지지 않게 함
+            font_manager.findfont(font_manager.FontProperties(family=family))
+            fig = Figure(figsize=(1, 1))
+            fig.text(0.5, 0.5, "가나다 abc −1")
+            FigureCanvasAgg(fig).draw()
+        _family = family or ""
+        return family
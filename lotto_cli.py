@@ -0,0 +1,113 @@
+# 로또 번호 일괄 생성 (명령줄, Streamlit 없이 실행)
+# 조각 단위로 생성해서 바로 기록하므로 수백만 세트도 일정한 메모리로 처리합니다.
+#
+#   python lotto_cli.py 1000000 -o tickets.csv
+#   python lotto_cli.py 5000000 --include 3,7 --exclude 10,20 --seed 42 -o tickets.parquet
+#   python lotto_cli.py 10 --unique            (출력 파일이 없으면 표준 출력으로 CSV)
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+from lotto_engine import BULK_CHUNK, iter_lotto, make_rng, parse_numbers, parse_seed
+from lotto_export import CSV_ENCODING, PARQUET_AVAILABLE
+from lotto_history import NUMBER_COLUMNS
+
+
+# (n, 6) 배열 → CSV 본문 바이트
+# 번호마다 [십의 자리, 일의 자리, 구분자] 3칸에 ASCII 코드를 채우고 빈 칸(0)만 지워서 한 번에 만듦
+def csv_block(tickets):
+    t = np.asarray(tickets, dtype=np.uint8)
+    chars = np.empty(t.shape + (3,), dtype=np.uint8)
+    chars[..., 0] = np.where(t >= 10, t // 10 + ord("0"), 0)
+    chars[..., 1] = t % 10 + ord("0")
+    chars[..., 2] = ord(",")
+    chars[:, -1, 2] = ord("\n")
+    flat = chars.ravel()
+    return flat[flat != 0].tobytes()
+
+
+def write_csv(batches, out, encoding="utf-8"):
+    out.write((",".join(NUMBER_COLUMNS) + "\n").encode(encoding))
+    total = 0
+    for tickets in batches:
+        out.write(csv_block(tickets))
+        total += len(tickets)
+    return total
+
+
+def write_parquet(batches, sink):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = pa.schema([(name, pa.uint8()) for name in NUMBER_COLUMNS])
+    total = 0
+    with pq.ParquetWriter(sink, schema, compression="zstd") as writer:
+        for tickets in batches:
+            columns = [pa.array(tickets[:, i]) for i in range(6)]
+            writer.write_table(pa.Table.from_arrays(columns, schema=schema))
+            total += len(tickets)
+    return total
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="로또 번호 일괄 생성 (1~45 중 6개)")
+    parser.add_argument("num_sets", type=int, help="생성할 세트 수")
+    parser.add_argument("-o", "--output", default="-", help="출력 파일 (.csv / .parquet, 기본: 표준 출력)")
+    parser.add_argument("--format", choices=["csv", "parquet"], help="출력 형식 (기본: 파일 확장자로 판단)")
+    parser.add_argument("--include", default="", help="강제로 포함할 숫자 (쉼표로 구분)")
+    parser.add_argument("--exclude", default="", help="제외할 숫자 (쉼표로 구분)")
+    parser.add_argument("--seed", default="", help="랜덤 시드 (같은 시드면 같은 결과)")
+    parser.add_argument("--no-sort", action="store_true", help="세트 안의 번호를 정렬하지 않음")
+    parser.add_argument("--unique", action="store_true", help="같은 조합이 두 번 나오지 않게 생성")
+    parser.add_argument("--batch-size", type=int, default=BULK_CHUNK, help="한 번에 생성할 세트 수")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.num_sets < 1 or args.batch_size < 1:
+        parser.error("세트 수와 조각 크기는 1 이상이어야 합니다.")
+    fmt = args.format or ("parquet" if args.output.endswith(".parquet") else "csv")
+    if fmt == "parquet" and not PARQUET_AVAILABLE:
+        parser.error("Parquet 출력에는 pyarrow가 필요합니다.")
+
+    include = parse_numbers(args.include)
+    exclude = parse_numbers(args.exclude)
+    rng = make_rng(parse_seed(args.seed))
+    try:
+        batches = iter_lotto(args.num_sets, include, exclude, not args.no_sort, rng,
+                             unique=args.unique, batch_size=args.batch_size)
+    except ValueError as e:
+        parser.error(str(e))
+
+    started = time.perf_counter()
+    try:
+        if args.output == "-":
+            out = sys.stdout.buffer
+            total = write_parquet(batches, out) if fmt == "parquet" else write_csv(batches, out)
+            out.flush()
+        elif fmt == "parquet":
+            total = write_parquet(batches, args.output)
+        else:
+            with open(args.output, "wb") as out:
+                total = write_csv(batches, out, CSV_ENCODING)
+    except ValueError as e:
+        print(f"오류: {e}", file=sys.stderr)
+        return 1
+    except BrokenPipeError:
+        # head 등으로 출력을 중간에 끊은 경우
+        sys.stdout = None
+        return 0
+    if args.output != "-":
+        size = os.path.getsize(args.output)
+        print(f"{total:,}세트 → {args.output} ({size / 1e6:.1f}MB, {time.perf_counter() - started:.1f}초)",
+              file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,202 @@
+# 지난 회차 당첨번호 파일(CSV / Parquet)을 읽어서 분석
+# 파일 형식: 회차, 날짜, 번호1~번호6, 보너스
+# 기본으로 들어 있는 data/sample_draws.csv는 무작위로 만든 예시 데이터이며 실제 당첨번호가 아닙니다.
+# 실제 데이터를 쓰려면 같은 형식의 파일 경로를 LOTTO_DRAWS_PATH로 지정하세요.
+import copy
+import os
+import shutil
+import threading
+
+import numpy as np
+import pandas as pd
+
+from lotto_history import NUMBER_COLUMNS
+from lotto_simulation import one_hot
+from lotto_stats import TicketStats
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SAMPLE_PATH = os.path.join(BASE_DIR, "data", "sample_draws.csv")
+DEFAULT_PATH = os.environ.get("LOTTO_DRAWS_PATH", SAMPLE_PATH)
+CACHE_DIR = os.path.join(BASE_DIR, ".cache", "draws")
+HEADER = ",".join(["회차", "날짜", *NUMBER_COLUMNS, "보너스"])
+
+
+def _read_file(path):
+    if path.endswith(".parquet"):
+        frame = pd.read_parquet(path)
+    else:
+        frame = pd.read_csv(path)
+    frame = frame.sort_values("회차")
+    return {
+        "round": frame["회차"].to_numpy(dtype=np.int32),
+        "date": pd.to_datetime(frame["날짜"]).to_numpy().astype("datetime64[D]"),
+        "numbers": frame[NUMBER_COLUMNS].to_numpy(dtype=np.uint8),
+        "bonus": frame["보너스"].to_numpy(dtype=np.uint8),
+    }
+
+
+def empty_draw_arrays():
+    return {
+        "round": np.empty(0, dtype=np.int32),
+        "date": np.empty(0, dtype="datetime64[D]"),
+        "numbers": np.empty((0, 6), dtype=np.uint8),
+        "bonus": np.empty(0, dtype=np.uint8),
+    }
+
+
+# 같은 파일의 예전 변환본(크기·mtime이 다른 것)을 지움. 다른 프로세스가 만드는 중인 .tmp 폴더는 건드리지 않음
+def _remove_old_caches(basename, keep):
+    for name in os.listdir(CACHE_DIR):
+        if name != keep and ".tmp" not in name and name.rsplit("-", 2)[0] == basename:
+            shutil.rmtree(os.path.join(CACHE_DIR, name), ignore_errors=True)
+
+
+# 원본 파일이 그대로면 지난번에 변환해 둔 .npy를 memmap으로 바로 엶
+def load_draw_arrays(path=DEFAULT_PATH):
+    stat = os.stat(path)
+    basename = os.path.basename(path)
+    key = f"{basename}-{stat.st_size}-{stat.st_mtime_ns}"
+    cache = os.path.join(CACHE_DIR, key)
+    if not os.path.isdir(cache):
+        arrays = _read_file(path)
+        tmp = cache + f".tmp{os.getpid()}"
+        os.makedirs(tmp, exist_ok=True)
+        for name, values in arrays.items():
+            np.save(os.path.join(tmp, f"{name}.npy"), values)
+        try:
+            os.replace(tmp, cache)
+        except OSError:
+            if not os.path.isdir(cache):
+                raise
+        _remove_old_caches(basename, key)
+    return {
+        name: np.load(os.path.join(cache, f"{name}.npy"), mmap_mode="r")
+        for name in ("round", "date", "numbers", "bonus")
+    }
+
+
+# 새 회차 번호는 지금까지의 마지막 회차보다 커야 함 (중복 / 순서가 뒤바뀐 회차 거부)
+def _check_next_round(rounds, round_no):
+    if len(rounds) and round_no <= int(rounds[-1]):
+        raise ValueError(f"{round_no}회는 이미 있거나 마지막 회차({int(rounds[-1])}회)보다 앞선 회차입니다.")
+
+
+class DrawArchive:
+    def __init__(self, arrays):
+        self.rounds = arrays["round"]
+        self.dates = arrays["date"]
+        self.numbers = arrays["numbers"]
+        self.bonus = arrays["bonus"]
+        self.version = 0
+        self._lock = threading.Lock()
+        # 누적 통계와 "마지막으로 나온 회차 위치"는 추가될 때마다 새 회차만큼만 갱신
+        self.stats = TicketStats()
+        self.stats.add(self.numbers)
+        self.last_seen = np.full(46, -1, dtype=np.int64)
+        if not len(self.numbers):
+            return
+        present = one_hot(self.numbers).astype(bool)
+        seen = present.any(axis=0)
+        self.last_seen[1:][seen] = len(present) - 1 - np.argmax(present[::-1], axis=0)[seen]
+
+    def __len__(self):
+        return len(self.rounds)
+
+    # 원본과 따로 회차를 추가할 수 있는 사본 (append는 배열을 새로 만들므로 원본 배열을 공유해도 안전)
+    # 통계는 다시 세지 않고 누적값만 복사
+    def copy(self):
+        with self._lock:
+            other = copy.copy(self)
+            other.stats = copy.deepcopy(self.stats)
+            other.last_seen = self.last_seen.copy()
+        other._lock = threading.Lock()
+        return other
+
+    def check_round(self, round_no):
+        _check_next_round(self.rounds, round_no)
+
+    # 새 회차 추가 (파일을 다시 읽지 않고 배열과 통계만 이어서 갱신)
+    def append(self, round_no, date, numbers, bonus):
+        numbers = np.sort(np.asarray(numbers, dtype=np.uint8)).reshape(1, 6)
+        with self._lock:
+            _check_next_round(self.rounds, round_no)
+            self.rounds = np.append(self.rounds, np.int32(round_no))
+            self.dates = np.append(self.dates, np.datetime64(date, "D"))
+            self.numbers = np.concatenate([self.numbers, numbers])
+            self.bonus = np.append(self.bonus, np.uint8(bonus))
+            self.stats.add(numbers)
+            self.last_seen[numbers[0]] = len(self.rounds) - 1
+            self.version += 1
+
+    # 최근 window회차의 번호별 등장 횟수 (window가 None이면 전체)
+    def frequency(self, window=None):
+        if window is None:
+            return self.stats.frequency[1:].copy()
+        recent = np.asarray(self.numbers[-window:], dtype=np.intp)
+        return np.bincount(recent.ravel(), minlength=46)[1:]
+
+    # 번호별로 마지막 등장 이후 지난 회차 수 (한 번도 안 나왔으면 전체 회차 수)
+    def gaps(self):
+        last = self.last_seen[1:]
+        return np.where(last >= 0, len(self) - 1 - last, len(self))
+
+    # 자주 함께 나온 번호 쌍 상위 n개: [(a, b, 횟수), ...]
+    def top_pairs(self, n=10):
+        upper = np.triu(self.stats.pairs, k=1)
+        flat = np.argsort(upper, axis=None)[::-1][:n]
+        a, b = np.unravel_index(flat, upper.shape)
+        return [(int(x), int(y), int(upper[x, y])) for x, y in zip(a, b)]
+
+    # 생성한 세트를 지난 회차와 비교: 세트마다 최고 일치 개수, 3개 이상 일치한 회차 수
+    def score_tickets(self, tickets):
+        matches = one_hot(tickets) @ one_hot(self.numbers).T
+        return matches.max(axis=1).astype(np.int8), (matches >= 3).sum(axis=1)
+
+
+# CSV 파일 끝에 한 줄만 덧붙임 (Parquet은 지원하지 않음). 파일이 없거나 비어 있으면 머리글부터 씀
+def append_draw_file(path, round_no, date, numbers, bonus):
+    numbers = sorted(int(n) for n in numbers)
+    line = ",".join(map(str, [round_no, str(np.datetime64(date, "D")), *numbers, int(bonus)]))
+    new = not os.path.exists(path) or os.path.getsize(path) == 0
+    with open(path, "a", encoding="utf-8") as f:
+        f.write((HEADER + "\n" if new else "") + line + "\n")
+
+
+def _file_signature(path):
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+# 한 파일의 DrawArchive를 모든 세션이 공유
+# 이 프로세스가 덧붙인 회차는 파일을 다시 읽지 않고 archive.append로만 반영하고,
+# 다른 곳에서 파일이 바뀐 경우(크기·mtime이 기억해 둔 값과 다름)에만 새로 읽습니다.
+class DrawFile:
+    def __init__(self, path=DEFAULT_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._signature = None
+        self._archive = None
+
+    def _load(self):
+        signature = _file_signature(self.path)
+        if self._archive is None or signature != self._signature:
+            arrays = load_draw_arrays(self.path) if signature else empty_draw_arrays()
+            self._archive = DrawArchive(arrays)
+            self._signature = signature
+        return self._archive
+
+    def archive(self):
+        with self._lock:
+            return self._load()
+
+    # 잠근 채로 마지막 회차를 확인하고 저장하므로, 두 세션이 같은 회차를 동시에 저장하지 못함
+    def append(self, round_no, date, numbers, bonus):
+        with self._lock:
+            archive = self._load()
+            archive.check_round(round_no)
+            append_draw_file(self.path, round_no, date, numbers, bonus)
+            archive.append(round_no, date, numbers, bonus)
+            self._signature = _file_signature(self.path)
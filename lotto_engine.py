@@ -0,0 +1,141 @@
+# 로또 번호 생성 로직 (Streamlit 없이도 import 해서 쓸 수 있음)
+from math import comb
+
+import numpy as np
+
+# 대량 생성 시 한 번에 처리할 행 수 (메모리 사용량 제한)
+BULK_CHUNK = 100_000
+
+
+# 문자열을 숫자 리스트로 변환 (1~45 밖의 값이나 숫자가 아닌 값은 무시)
+def parse_numbers(text):
+    if not text:
+        return []
+    nums = []
+    for part in text.split(","):
+        try:
+            n = int(part.strip())
+            if 1 <= n <= 45:
+                nums.append(n)
+        except ValueError:
+            continue
+    return sorted(set(nums))
+
+
+# 포함/제외 조건 검증 (문제가 있으면 ValueError)
+def validate_numbers(include, exclude):
+    if len(include) > 6:
+        raise ValueError("포함할 숫자는 최대 6개까지만 지정할 수 있습니다.")
+    if set(include) & set(exclude):
+        raise ValueError("포함 숫자와 제외 숫자에 같은 값이 존재합니다.")
+    if len(exclude) >= 45:
+        raise ValueError("제외 숫자가 너무 많습니다.")
+
+
+# 시드 입력 문자열 → 정수 (숫자가 아니면 글자 코드의 합, 비어 있으면 None)
+def parse_seed(text):
+    if not text.strip():
+        return None
+    try:
+        return int(text)
+    except ValueError:
+        return sum(ord(c) for c in text)
+
+
+# 난수 생성기는 전역 random 모듈 대신 세션/작업마다 따로 만듭니다.
+# 같은 시드 → 같은 SeedSequence → 같은 결과 (다른 세션이 무엇을 하든 상관없음)
+def make_seed_sequence(seed=None):
+    if seed is None:
+        return np.random.SeedSequence()
+    # 음수 시드도 받을 수 있도록 128비트 범위로 접어 넣음
+    return np.random.SeedSequence(seed & (2**128 - 1))
+
+
+def make_rng(seed=None):
+    return np.random.default_rng(make_seed_sequence(seed))
+
+
+# 병렬 작업용: 부모 시드에서 서로 겹치지 않는 자식 스트림 n개
+def spawn_rngs(seed_seq, n):
+    return [np.random.default_rng(child) for child in seed_seq.spawn(n)]
+
+
+# 번호 생성 함수
+def generate_lotto(include, exclude, sort_flag=True, rng=None):
+    if rng is None:
+        rng = np.random.default_rng()
+    pool = [n for n in range(1, 46) if n not in exclude and n not in include]
+    need = 6 - len(include)
+    if len(pool) < need:
+        raise ValueError("조건에 맞는 번호를 생성할 수 없습니다.")
+    picked = rng.choice(pool, need, replace=False).tolist()
+    result = include + picked
+    if sort_flag:
+        result = sorted(result)
+    return result
+
+
+# 포함/제외 조건을 적용한 후보 번호 배열
+def candidate_pool(include, exclude):
+    mask = np.ones(46, dtype=bool)
+    mask[0] = False
+    mask[list(include)] = False
+    mask[list(exclude)] = False
+    return np.flatnonzero(mask).astype(np.uint8)
+
+
+# 대량 생성: num_sets × 6 배열(uint8)을 NumPy로 한 번에 생성
+# 각 행마다 후보 번호에 난수 키를 붙이고, 키가 가장 작은 need개를 뽑습니다 (argpartition).
+def generate_lotto_bulk(num_sets, include, exclude, sort_flag=True, rng=None):
+    if rng is None:
+        rng = np.random.default_rng()
+    pool = candidate_pool(include, exclude)
+    need = 6 - len(include)
+    if len(pool) < need:
+        raise ValueError("조건에 맞는 번호를 생성할 수 없습니다.")
+
+    tickets = np.empty((num_sets, 6), dtype=np.uint8)
+    tickets[:, :len(include)] = include
+    if need:
+        for start in range(0, num_sets, BULK_CHUNK):
+            stop = min(start + BULK_CHUNK, num_sets)
+            keys = rng.random((stop - start, len(pool)), dtype=np.float32)
+            idx = np.argpartition(keys, need - 1, axis=1)[:, :need]
+            # 뽑힌 번호의 순서도 random.sample처럼 무작위가 되도록 키 값 순으로 정렬
+            order = np.argsort(np.take_along_axis(keys, idx, axis=1), axis=1)
+            tickets[start:stop, len(include):] = pool[np.take_along_axis(idx, order, axis=1)]
+    if sort_flag:
+        tickets.sort(axis=1)
+    return tickets
+
+
+# 스트리밍 생성: num_sets세트를 batch_size행씩 (n, 6) 배열로 차례차례 내보내는 반복자
+# 한 번에 한 조각만 메모리에 있으므로 세트 수와 상관없이 메모리 사용량이 일정합니다.
+# unique=True면 이번 실행 안에서 같은 조합이 다시 나오지 않음 (비트셋 약 1MB)
+# 조건 검증은 반복을 시작하기 전에 바로 하므로, 출력을 쓰기 전에 오류를 알 수 있습니다.
+def iter_lotto(num_sets, include, exclude, sort_flag=True, rng=None, unique=False, batch_size=BULK_CHUNK):
+    validate_numbers(include, exclude)
+    need = 6 - len(include)
+    pool = candidate_pool(include, exclude)
+    if len(pool) < need:
+        raise ValueError("조건에 맞는 번호를 생성할 수 없습니다.")
+    if unique and comb(len(pool), need) < num_sets:
+        raise ValueError("조건에 맞는 중복 없는 조합이 부족합니다.")
+    if rng is None:
+        rng = np.random.default_rng()
+    return _iter_lotto(num_sets, include, exclude, sort_flag, rng, unique, batch_size)
+
+
+def _iter_lotto(num_sets, include, exclude, sort_flag, rng, unique, batch_size):
+    if unique:
+        # lotto_rank가 이 모듈을 import하므로 여기서 가져옴
+        from lotto_rank import iter_unique_ranks, unrank_tickets
+        for ranks in iter_unique_ranks(num_sets, include, exclude, rng, batch_size):
+            tickets = unrank_tickets(ranks)
+            if not sort_flag:
+                tickets = rng.permuted(tickets, axis=1)
+            yield tickets
+        return
+    for start in range(0, num_sets, batch_size):
+        n = min(batch_size, num_sets - start)
+        yield generate_lotto_bulk(n, include, exclude, sort_flag, rng)
@@ -0,0 +1,78 @@
+# 히스토리 내보내기 (CSV / Parquet)
+# 다운로드 버튼을 누를 때만 만들고, 히스토리 버전이 같으면 만든 바이트를 그대로 재사용합니다.
+# CSV는 새로 추가된 행만 이어 붙이므로 매번 전체를 다시 쓰지 않습니다.
+import importlib.util
+import io
+import threading
+
+EXPORT_CHUNK = 100_000
+CSV_ENCODING = "utf-8-sig"
+
+PARQUET_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+
+# 히스토리 [start, stop) 구간을 CSV 조각(bytes)으로 차례차례 내보냄
+def iter_csv_chunks(history, start=0, stop=None, header=True):
+    stop = len(history) if stop is None else stop
+    if header:
+        columns = history.to_frame(0, 0).columns
+        yield (",".join(columns) + "\n").encode(CSV_ENCODING)
+    for lo in range(start, stop, EXPORT_CHUNK):
+        hi = min(lo + EXPORT_CHUNK, stop)
+        yield history.to_frame(lo, hi).to_csv(index=False, header=False).encode("utf-8")
+
+
+# 히스토리 전체를 Parquet으로 파일(또는 버퍼)에 조각 단위로 기록
+def write_parquet(history, sink):
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    writer = None
+    try:
+        for lo in range(0, max(len(history), 1), EXPORT_CHUNK):
+            frame = history.to_frame(lo, min(lo + EXPORT_CHUNK, len(history)))
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(sink, table.schema, compression="zstd")
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+class HistoryExporter:
+    def __init__(self, history):
+        self.history = history
+        self._lock = threading.Lock()
+        # CSV는 합친 바이트 하나만 보관 (조각 목록을 따로 들고 있으면 메모리가 두 배로 듦)
+        self._csv_epoch = None
+        self._csv_rows = 0
+        self._csv_cache = (None, b"")
+        self._parquet_cache = (None, b"")
+
+    def csv_bytes(self):
+        with self._lock:
+            history = self.history
+            version, data = self._csv_cache
+            if version == history.version:
+                return data
+            size = len(history)
+            if self._csv_epoch != history.epoch or size < self._csv_rows:
+                # 초기화된 뒤에는 처음부터 다시
+                data = b"".join(iter_csv_chunks(history, 0, 0))
+                self._csv_epoch = history.epoch
+                self._csv_rows = 0
+            # 지난번 이후에 추가된 행만 이어 붙임
+            data += b"".join(iter_csv_chunks(history, self._csv_rows, size, header=False))
+            self._csv_rows = size
+            self._csv_cache = (history.version, data)
+            return data
+
+    def parquet_bytes(self):
+        with self._lock:
+            version = self.history.version
+            if self._parquet_cache[0] != version:
+                buf = io.BytesIO()
+                write_parquet(self.history, buf)
+                self._parquet_cache = (version, buf.getvalue())
+            return self._parquet_cache[1]
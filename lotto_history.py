@@ -0,0 +1,146 @@
+# 로또 생성 히스토리 저장소
+# 세트마다 dict를 만드는 대신, 미리 잡아 둔 배열에 열(column) 단위로 저장합니다.
+#   번호: uint8 × 6, 배치 id: uint32, 생성 시각: int64(초)  → 세트당 18바이트
+from collections import OrderedDict
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+NUMBER_COLUMNS = [f"번호{i + 1}" for i in range(6)]
+
+
+class LottoHistory:
+    def __init__(self, capacity=1024):
+        self._tickets = np.empty((capacity, 6), dtype=np.uint8)
+        self._batch = np.empty(capacity, dtype=np.uint32)
+        self._time = np.empty(capacity, dtype=np.int64)
+        self._batch_start = []  # 배치별 시작 행 (세트 번호 계산용)
+        self._size = 0
+        self.version = 0  # 내용이 바뀔 때마다 1씩 증가 (캐시 무효화용)
+        self.epoch = 0  # 초기화할 때마다 1씩 증가 (이어 붙이기가 불가능해진 시점)
+
+    def __len__(self):
+        return self._size
+
+    @property
+    def tickets(self):
+        return self._tickets[:self._size]
+
+    @property
+    def batches(self):
+        return self._batch[:self._size]
+
+    @property
+    def times(self):
+        return self._time[:self._size]
+
+    @property
+    def nbytes(self):
+        return self._tickets.nbytes + self._batch.nbytes + self._time.nbytes
+
+    # [start, stop) 구간의 번호 배열, 최근 n세트
+    def tickets_range(self, start=0, stop=None):
+        return self._tickets[start:self._size if stop is None else stop]
+
+    def last_tickets(self, n):
+        return self.tickets_range(max(0, self._size - n))
+
+    def _reserve(self, extra):
+        need = self._size + extra
+        capacity = len(self._time)
+        if need <= capacity:
+            return
+        while capacity < need:
+            capacity *= 2
+        for name in ("_tickets", "_batch", "_time"):
+            old = getattr(self, name)
+            new = np.empty((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, name, new)
+
+    # 한 번의 "생성하기"로 만든 세트들을 하나의 배치로 추가하고 배치 id를 돌려줌
+    def append(self, tickets, when=None):
+        tickets = np.asarray(tickets, dtype=np.uint8).reshape(-1, 6)
+        when = when or datetime.now()
+        n = len(tickets)
+        self._reserve(n)
+        batch_id = len(self._batch_start)
+        start, stop = self._size, self._size + n
+        self._tickets[start:stop] = tickets
+        self._batch[start:stop] = batch_id
+        self._time[start:stop] = np.datetime64(when, "s").astype(np.int64)
+        self._batch_start.append(start)
+        self._size = stop
+        self.version += 1
+        return batch_id
+
+    def clear(self):
+        self._batch_start = []
+        self._size = 0
+        self.version += 1
+        self.epoch += 1
+
+    # 배치 안에서의 세트 번호 (1부터)
+    def set_numbers(self, start=0, stop=None):
+        stop = self._size if stop is None else stop
+        starts = np.asarray(self._batch_start, dtype=np.int64)
+        return np.arange(start, stop) - starts[self._batch[start:stop]] + 1
+
+    # 전체(또는 일부) 히스토리 DataFrame — 번호/시각 열은 배열을 복사하지 않고 그대로 사용
+    def to_frame(self, start=0, stop=None):
+        stop = self._size if stop is None else stop
+        columns = {
+            "시간": self._time[start:stop].view("datetime64[s]"),
+            "세트": self.set_numbers(start, stop),
+        }
+        for i, name in enumerate(NUMBER_COLUMNS):
+            columns[name] = self._tickets[start:stop, i]
+        return pd.DataFrame(columns, copy=False)
+
+    # 최근 n세트 (최신순, 번호는 문자열로 합침)
+    def recent_frame(self, n):
+        start = max(0, self._size - n)
+        rows = slice(start, self._size)
+        times = pd.Series(self._time[rows].view("datetime64[s]"))
+        return pd.DataFrame({
+            "시간": times.dt.strftime("%Y-%m-%d %H:%M:%S"),
+            "세트번호": self.set_numbers(start),
+            "번호": [", ".join(map(str, t)) for t in self._tickets[rows].tolist()],
+        }).iloc[::-1].reset_index(drop=True)
+
+
+# 전체 히스토리를 페이지 단위로 잘라서 보여주기 위한 도우미
+# 꽉 찬 페이지는 새 세트가 추가돼도 바뀌지 않으므로 초기화 전까지 그대로 캐시합니다.
+class HistoryPager:
+    def __init__(self, history, max_pages=64):
+        self.history = history
+        self.max_pages = max_pages
+        self._pages = OrderedDict()
+        self._recent = (None, None)
+
+    def num_pages(self, page_size):
+        return max(1, -(-len(self.history) // page_size))
+
+    def page(self, index, page_size):
+        start = index * page_size
+        stop = min(start + page_size, len(self.history))
+        full = stop - start == page_size
+        key = (self.history.epoch, page_size, index)
+        if full and key in self._pages:
+            self._pages.move_to_end(key)
+            return self._pages[key]
+        # 작은 조각만 복사해 두어 커지기 전의 큰 배열을 붙잡고 있지 않게 함
+        frame = self.history.to_frame(start, stop).copy()
+        frame.index = pd.RangeIndex(start + 1, stop + 1)
+        if full:
+            self._pages[key] = frame
+            while len(self._pages) > self.max_pages:
+                self._pages.popitem(last=False)
+        return frame
+
+    def recent(self, n):
+        key = (self.history.version, n)
+        if self._recent[0] != key:
+            self._recent = (key, self.history.recent_frame(n))
+        return self._recent[1]
@@ -0,0 +1,96 @@
+# 대량 생성 작업을 여러 프로세스(CPU 코어)로 나눠 처리
+# 각 조각(shard)은 부모 SeedSequence에서 나온 자식 시드를 쓰므로,
+# 작업자 수나 끝나는 순서와 상관없이 같은 시드면 같은 결과가 나옵니다.
+# 결과는 공유 메모리에 바로 써서 프로세스 간 복사(pickle)를 피합니다.
+import multiprocessing
+import os
+import sys
+import threading
+import types
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from lotto_engine import generate_lotto_bulk
+
+SHARD_SIZE = 250_000
+
+_lock = threading.Lock()
+_pool = None
+
+
+def make_process_pool(workers=None):
+    # Streamlit 서버는 여러 스레드를 쓰므로 fork 대신 spawn으로 작업자를 띄움
+    return ProcessPoolExecutor(
+        max_workers=workers or os.cpu_count() or 1,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+# 프로세스 안의 모든 세션·페이지가 함께 쓰는 작업자 풀 (처음 필요할 때 한 번만 만듦)
+def get_process_pool():
+    global _pool
+    with _lock:
+        if _pool is None:
+            _pool = make_process_pool()
+        return _pool
+
+
+# spawn 작업자는 시작할 때 부모의 __main__ 파일을 다시 실행합니다. Streamlit에서는 실행 중인 페이지가
+# __main__이므로, 작업을 넘기는(작업자가 뜰 수 있는) 동안에는 파일 없는 빈 모듈로 바꿔 둠
+@contextmanager
+def _without_main():
+    with _lock:
+        main = sys.modules["__main__"]
+        stub = types.ModuleType("__main__")
+        sys.modules["__main__"] = stub
+        try:
+            yield
+        finally:
+            if sys.modules["__main__"] is stub:
+                sys.modules["__main__"] = main
+
+
+def shard_ranges(total, shard_size=SHARD_SIZE):
+    return [(start, min(start + shard_size, total)) for start in range(0, total, shard_size)]
+
+
+# 작업자 프로세스: 공유 메모리의 [start, stop) 행을 채움
+def _fill_shard(shm_name, total, start, stop, include, exclude, sort_flag, seed):
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        out = np.ndarray((total, 6), dtype=np.uint8, buffer=shm.buf)
+        rng = np.random.default_rng(seed)
+        out[start:stop] = generate_lotto_bulk(stop - start, include, exclude, sort_flag, rng)
+        del out
+    finally:
+        shm.close()
+    return stop - start
+
+
+# 여러 프로세스로 num_sets × 6 배열을 생성. progress(완료 세트 수, 전체)로 진행 상황을 알려줌
+def generate_lotto_parallel(num_sets, include, exclude, sort_flag, seed_seq, executor,
+                            shard_size=SHARD_SIZE, progress=None):
+    shards = shard_ranges(num_sets, shard_size)
+    seeds = seed_seq.spawn(len(shards))
+    shm = shared_memory.SharedMemory(create=True, size=max(1, num_sets * 6))
+    futures = []
+    try:
+        with _without_main():
+            for (start, stop), seed in zip(shards, seeds):
+                futures.append(executor.submit(_fill_shard, shm.name, num_sets, start, stop,
+                                               list(include), list(exclude), sort_flag, seed))
+        done = 0
+        for future in as_completed(futures):
+            done += future.result()
+            if progress is not None:
+                progress(done, num_sets)
+        return np.ndarray((num_sets, 6), dtype=np.uint8, buffer=shm.buf).copy()
+    finally:
+        # 중간에 멈추면(다시 실행, 오류) 아직 시작하지 않은 조각은 취소
+        for future in futures:
+            future.cancel()
+        shm.close()
+        shm.unlink()
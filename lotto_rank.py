@@ -0,0 +1,153 @@
+# 로또 번호 조합 ↔ 순번(rank) 변환 (조합수 체계, combinadic)
+# 가능한 조합은 C(45, 6) = 8,145,060개뿐이라 한 세트를 23비트 정수 하나로 나타낼 수 있습니다.
+from math import comb
+
+import numpy as np
+
+from lotto_engine import candidate_pool
+
+TOTAL = comb(45, 6)
+
+# BINOM[n, k] = C(n, k)  (n = 0..45, k = 0..6)
+BINOM = np.array([[comb(n, k) for k in range(7)] for n in range(46)], dtype=np.int64)
+
+
+# 0부터 시작하는 오름차순 인덱스 (N, k) → 순번 (colex 순서)
+def _rank(idx):
+    idx = np.asarray(idx, dtype=np.int64)
+    k = idx.shape[1]
+    return BINOM[idx, np.arange(1, k + 1)].sum(axis=1)
+
+
+# 순번 → 0부터 시작하는 오름차순 인덱스 (N, k)
+def _unrank(ranks, k):
+    r = np.array(ranks, dtype=np.int64)
+    idx = np.empty((len(r), k), dtype=np.int64)
+    for i in range(k, 0, -1):
+        # C(c, i) <= r 를 만족하는 가장 큰 c
+        c = np.searchsorted(BINOM[:, i], r, side="right") - 1
+        idx[:, i - 1] = c
+        r -= BINOM[c, i]
+    return idx
+
+
+# 로또 세트 (N, 6), 번호 1~45 → 순번 (0 ~ TOTAL-1)
+def rank_tickets(tickets):
+    tickets = np.sort(np.asarray(tickets, dtype=np.int64).reshape(-1, 6), axis=1)
+    return _rank(tickets - 1)
+
+
+# 순번 → 정렬된 로또 세트 (N, 6), uint8
+def unrank_tickets(ranks):
+    return (_unrank(np.ravel(ranks), 6) + 1).astype(np.uint8)
+
+
+# 순번 공간 전체에 대한 비트셋 (약 1MB) — 중복 검사와 소속 여부를 O(1)에 처리
+class TicketSet:
+    def __init__(self):
+        self._bits = np.zeros((TOTAL + 7) // 8, dtype=np.uint8)
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def contains(self, ranks):
+        ranks = np.asarray(ranks, dtype=np.int64)
+        return (self._bits[ranks >> 3] & (1 << (ranks & 7)).astype(np.uint8)) != 0
+
+    def add(self, ranks):
+        ranks = np.unique(np.asarray(ranks, dtype=np.int64))
+        ranks = ranks[~self.contains(ranks)]
+        np.bitwise_or.at(self._bits, ranks >> 3, (1 << (ranks & 7)).astype(np.uint8))
+        self.count += len(ranks)
+
+    def clear(self):
+        self._bits[:] = 0
+        self.count = 0
+
+
+# 조건 공간을 펼칠 때 한 번에 다루는 순번 수 (중간 배열이 공간 전체 크기로 커지지 않게 함)
+ENUM_CHUNK = 1 << 18
+
+
+# 포함/제외 조건을 만족하는 세트 수와, 조건 공간의 순번 → 전체 순번 변환 함수
+def _condition_space(include, exclude):
+    pool = candidate_pool(include, exclude).astype(np.int64)
+    need = 6 - len(include)
+    if len(pool) < need:
+        raise ValueError("조건에 맞는 번호를 생성할 수 없습니다.")
+    fixed = np.asarray(include, dtype=np.int64)
+
+    def to_ranks(sub_ranks):
+        # 조건 공간의 순번 → 후보 번호 조합 → 전체 순번
+        picked = pool[_unrank(sub_ranks, need)]
+        tickets = np.concatenate([np.broadcast_to(fixed, (len(sub_ranks), len(fixed))), picked], axis=1)
+        return rank_tickets(tickets)
+
+    return comb(len(pool), need), to_ranks
+
+
+# 조건 공간에서 아직 seen에 없는 순번 전부 (조각 단위로 펼침, 순번은 TOTAL < 2^31 이므로 int32로 보관)
+def _unseen_ranks(space, to_ranks, seen):
+    parts = [np.empty(0, dtype=np.int32)]
+    for lo in range(0, space, ENUM_CHUNK):
+        ranks = to_ranks(np.arange(lo, min(lo + ENUM_CHUNK, space)))
+        parts.append(ranks[~seen.contains(ranks)].astype(np.int32))
+    return np.concatenate(parts)
+
+
+# 무작위로 뽑고 비트셋으로 거르면서 모자란 만큼 다시 뽑기 (남은 조합이 넉넉할 때)
+def _reject_sample(num_sets, space, to_ranks, rng, seen):
+    result = []
+    remaining = num_sets
+    while remaining:
+        ranks = to_ranks(rng.integers(0, space, size=max(2 * remaining, 1024)))
+        _, first = np.unique(ranks, return_index=True)
+        ranks = ranks[np.sort(first)]
+        ranks = ranks[~seen.contains(ranks)][:remaining]
+        seen.add(ranks)
+        result.append(ranks)
+        remaining -= len(ranks)
+    return np.concatenate(result)
+
+
+# 포함/제외 조건을 만족하는 세트 중에서 균등하게 순번을 뽑음
+# seen에 이미 있는 세트와 이번에 뽑은 세트끼리는 겹치지 않습니다.
+def sample_unique_ranks(num_sets, include, exclude, rng=None, seen=None):
+    if rng is None:
+        rng = np.random.default_rng()
+    if seen is None:
+        seen = TicketSet()
+    space, to_ranks = _condition_space(include, exclude)
+
+    # 조건 공간이 작거나 거의 다 나온 경우에는 전부 펼쳐서 아직 안 나온 것만 남김
+    if space <= 4 * num_sets or space - len(seen) <= 4 * num_sets:
+        ranks = _unseen_ranks(space, to_ranks, seen)
+        if len(ranks) < num_sets:
+            raise ValueError("조건에 맞는 중복 없는 조합이 부족합니다.")
+        ranks = rng.choice(ranks, num_sets, replace=False).astype(np.int64)
+        seen.add(ranks)
+        return ranks
+    return _reject_sample(num_sets, space, to_ranks, rng, seen)
+
+
+# 한 번의 실행에서 서로 다른 순번 num_sets개를 batch_size개씩 차례로 내보냄
+# 남은 조합이 부족해지면 그때 한 번만 나머지 전체를 펼쳐 섞고, 이후 배치는 거기서 잘라 씀
+# (배치마다 조건 공간 전체를 다시 펼치지 않음)
+def iter_unique_ranks(num_sets, include, exclude, rng=None, batch_size=ENUM_CHUNK):
+    if rng is None:
+        rng = np.random.default_rng()
+    space, to_ranks = _condition_space(include, exclude)
+    if space < num_sets:
+        raise ValueError("조건에 맞는 중복 없는 조합이 부족합니다.")
+    seen = TicketSet()
+    remaining = num_sets
+    while remaining and space - len(seen) > 4 * remaining:
+        n = min(batch_size, remaining)
+        yield _reject_sample(n, space, to_ranks, rng, seen)
+        remaining -= n
+    if remaining:
+        rest = _unseen_ranks(space, to_ranks, seen)
+        rest = rng.permutation(rest)[:remaining]
+        for lo in range(0, remaining, batch_size):
+            yield rest[lo:lo + batch_size].astype(np.int64)
@@ -0,0 +1,46 @@
+# 생성한 번호로 몇 개나 맞힐 수 있는지 모의 추첨 (몬테카를로)
+# 번호 세트를 45칸 원-핫 행렬로 바꾸면 "맞힌 개수" = 두 행렬의 곱이 되므로
+# 파이썬 반복문 없이 (세트 수 × 추첨 수) 전체를 한 번에 셉니다.
+from math import comb
+
+import numpy as np
+
+from lotto_engine import generate_lotto_bulk
+from lotto_rank import TOTAL
+
+# 한 조각에서 계산할 (세트 × 추첨) 쌍의 최대 개수, 한 조각의 최대 추첨 수
+CHUNK_PAIRS = 4_000_000
+MAX_CHUNK_DRAWS = 200_000
+
+# 시뮬레이션 한 번에 계산할 (세트 × 추첨) 쌍의 상한 (코어 하나로 약 15초)
+# 한 사용자가 서버를 오래 붙잡지 않도록 페이지에서 추첨 횟수를 이 안으로 제한합니다.
+MAX_SIM_PAIRS = 2_000_000_000
+
+
+# 맞힌 개수 m = 0..6 의 정확한 확률 (초기하분포)
+def exact_match_probabilities():
+    return np.array([comb(6, m) * comb(39, 6 - m) / TOTAL for m in range(7)])
+
+
+def one_hot(tickets):
+    tickets = np.asarray(tickets, dtype=np.intp).reshape(-1, 6)
+    out = np.zeros((len(tickets), 45), dtype=np.float32)
+    out[np.arange(len(tickets))[:, None], tickets - 1] = 1.0
+    return out
+
+
+# 추첨을 조각 단위로 진행하며 (지금까지 추첨 수, 맞힌 개수별 누적 횟수[7])를 계속 내보냄
+def simulate_matches(tickets, num_draws, rng=None):
+    if rng is None:
+        rng = np.random.default_rng()
+    ticket_matrix = one_hot(tickets)
+    chunk = int(min(MAX_CHUNK_DRAWS, max(1, CHUNK_PAIRS // len(ticket_matrix))))
+    counts = np.zeros(7, dtype=np.int64)
+    done = 0
+    while done < num_draws:
+        n = min(chunk, num_draws - done)
+        draws = one_hot(generate_lotto_bulk(n, [], [], False, rng))
+        matches = (ticket_matrix @ draws.T).astype(np.intp)
+        counts += np.bincount(matches.ravel(), minlength=7)
+        done += n
+        yield done, counts.copy()
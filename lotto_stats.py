@@ -0,0 +1,35 @@
+# 생성된 번호에 대한 누적 통계
+# 새 배치가 추가될 때 그 배치만 세어서 더하므로, 히스토리 전체를 다시 훑지 않습니다.
+from itertools import combinations
+
+import numpy as np
+
+# 한 세트 안의 15가지 번호 쌍 (열 인덱스)
+PAIR_I, PAIR_J = (np.array(ix) for ix in zip(*combinations(range(6), 2)))
+
+
+class TicketStats:
+    def __init__(self):
+        self.version = 0  # 내용이 바뀔 때마다 1씩 증가 (초기화할 때도 — 캐시 무효화용)
+        self.clear()
+
+    def clear(self):
+        self.count = 0
+        self.version += 1
+        self.frequency = np.zeros(46, dtype=np.int64)  # 번호별 등장 횟수 (0번 칸은 사용 안 함)
+        self.pairs = np.zeros((46, 46), dtype=np.int64)  # 두 번호가 한 세트에 함께 나온 횟수
+        self.sums = np.zeros(256, dtype=np.int64)  # 번호 합계 분포
+        self.odd = np.zeros(7, dtype=np.int64)  # 홀수 개수(0~6) 분포
+
+    def add(self, tickets):
+        t = np.asarray(tickets, dtype=np.intp).reshape(-1, 6)
+        if not len(t):
+            return
+        self.frequency += np.bincount(t.ravel(), minlength=46)
+        pair_index = (t[:, PAIR_I] * 46 + t[:, PAIR_J]).ravel()
+        pairs = np.bincount(pair_index, minlength=46 * 46).reshape(46, 46)
+        self.pairs += pairs + pairs.T
+        self.sums += np.bincount(t.sum(axis=1), minlength=256)
+        self.odd += np.bincount((t & 1).sum(axis=1), minlength=7)
+        self.count += len(t)
+        self.version += 1
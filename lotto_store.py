@@ -0,0 +1,135 @@
+# SQLite에 저장하는 로또 히스토리 (LottoHistory와 같은 방식으로 사용)
+# 새로고침해도 기록이 남고, 화면에 보이는 범위만 그때그때 읽어 오므로
+# 세션이 오래 살아 있어도 메모리가 늘어나지 않습니다.
+import os
+import sqlite3
+import threading
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from lotto_history import NUMBER_COLUMNS
+
+DEFAULT_DB_PATH = os.environ.get("LOTTO_HISTORY_DB", "")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tickets (
+    session TEXT NOT NULL,
+    seq     INTEGER NOT NULL,  -- 세션 안에서의 순서 (0부터)
+    batch   INTEGER NOT NULL,
+    set_no  INTEGER NOT NULL,
+    created INTEGER NOT NULL,  -- 생성 시각 (초)
+    numbers BLOB NOT NULL,     -- 번호 6개 (uint8 × 6, 생성된 순서 그대로)
+    PRIMARY KEY (session, seq)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS tickets_session_time ON tickets (session, created);
+"""
+
+
+def connect(path):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA busy_timeout=5000")
+    conn.executescript(SCHEMA)
+    return conn
+
+
+def _unpack(blobs):
+    return np.frombuffer(b"".join(blobs), dtype=np.uint8).reshape(-1, 6)
+
+
+class SQLiteHistory:
+    def __init__(self, path, session):
+        self.session = session
+        self._conn = connect(path)
+        self._lock = threading.Lock()
+        self.version = 0
+        self.epoch = 0
+        with self._lock:
+            self._size, self._batches = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(MAX(batch) + 1, 0) FROM tickets WHERE session = ?",
+                (session,),
+            ).fetchone()
+
+    def __len__(self):
+        return self._size
+
+    def _rows(self, start, stop):
+        with self._lock:
+            return self._conn.execute(
+                "SELECT created, set_no, numbers FROM tickets"
+                " WHERE session = ? AND seq >= ? AND seq < ? ORDER BY seq",
+                (self.session, start, stop),
+            ).fetchall()
+
+    # 한 번의 "생성하기"를 하나의 트랜잭션으로 저장
+    def append(self, tickets, when=None):
+        tickets = np.ascontiguousarray(tickets, dtype=np.uint8).reshape(-1, 6)
+        created = int(np.datetime64(when or datetime.now(), "s").astype(np.int64))
+        with self._lock:
+            # 같은 sid를 연 다른 탭(연결)이 그사이에 저장했을 수 있으므로,
+            # 쓰기 잠금을 잡은 뒤 DB에서 다음 순서와 배치 번호를 다시 읽음
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                start, batch_id = self._conn.execute(
+                    "SELECT COALESCE(MAX(seq) + 1, 0), COALESCE(MAX(batch) + 1, 0) FROM tickets"
+                    " WHERE session = ?",
+                    (self.session,),
+                ).fetchone()
+                rows = (
+                    (self.session, start + i, batch_id, i + 1, created, row.tobytes())
+                    for i, row in enumerate(tickets)
+                )
+                self._conn.executemany("INSERT INTO tickets VALUES (?, ?, ?, ?, ?, ?)", rows)
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._size = start + len(tickets)
+            self._batches = batch_id + 1
+            self.version += 1
+        return batch_id
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM tickets WHERE session = ?", (self.session,))
+            self._size = 0
+            self._batches = 0
+            self.version += 1
+            self.epoch += 1
+
+    def tickets_range(self, start=0, stop=None):
+        stop = self._size if stop is None else stop
+        with self._lock:
+            blobs = self._conn.execute(
+                "SELECT numbers FROM tickets WHERE session = ? AND seq >= ? AND seq < ? ORDER BY seq",
+                (self.session, start, stop),
+            ).fetchall()
+        return _unpack([b for (b,) in blobs])
+
+    def last_tickets(self, n):
+        return self.tickets_range(max(0, self._size - n))
+
+    def to_frame(self, start=0, stop=None):
+        stop = self._size if stop is None else stop
+        rows = self._rows(start, stop)
+        tickets = _unpack([r[2] for r in rows])
+        columns = {
+            "시간": np.array([r[0] for r in rows], dtype=np.int64).view("datetime64[s]"),
+            "세트": np.array([r[1] for r in rows], dtype=np.int64),
+        }
+        for i, name in enumerate(NUMBER_COLUMNS):
+            columns[name] = tickets[:, i]
+        return pd.DataFrame(columns)
+
+    def recent_frame(self, n):
+        start = max(0, self._size - n)
+        frame = self.to_frame(start)
+        return pd.DataFrame({
+            "시간": frame["시간"].dt.strftime("%Y-%m-%d %H:%M:%S"),
+            "세트번호": frame["세트"],
+            "번호": [", ".join(map(str, t)) for t in frame[NUMBER_COLUMNS].to_numpy().tolist()],
+        }).iloc[::-1].reset_index(drop=True)
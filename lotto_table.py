@@ -0,0 +1,133 @@
+# 전체 조합 표 (C(45, 6) = 8,145,060행)를 디스크에 한 번 만들어 두고 memmap으로 공유
+# 행 번호 = 조합 순번(rank)이므로 lotto_rank와 그대로 맞물립니다.
+#   tickets: uint8 × 6   sum: 합계   odd: 홀수 개수   run: 최장 연속 번호 길이
+#   low: 1~22 개수      decades: 걸친 번호대(1~9, 10~19, ...) 수   bits: 번호 비트마스크
+import os
+import shutil
+import tempfile
+
+import numpy as np
+
+from lotto_rank import TOTAL, unrank_tickets
+
+DEFAULT_DIR = os.environ.get(
+    "LOTTO_TABLE_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "lotto_table"),
+)
+BUILD_CHUNK = 1_000_000
+
+COLUMNS = {
+    "tickets": (np.uint8, (6,)),
+    "sum": (np.uint16, ()),
+    "odd": (np.uint8, ()),
+    "run": (np.uint8, ()),
+    "low": (np.uint8, ()),
+    "decades": (np.uint8, ()),
+    "bits": (np.uint64, ()),
+}
+
+
+# 정렬된 세트 (N, 6)에 대한 특징 열 계산
+def ticket_features(tickets):
+    t = np.asarray(tickets, dtype=np.uint8)
+    diff = np.diff(t.astype(np.int16), axis=1)
+    run = np.zeros(len(t), dtype=np.uint8)
+    best = np.zeros(len(t), dtype=np.uint8)
+    for i in range(diff.shape[1]):
+        run = np.where(diff[:, i] == 1, run + 1, 0).astype(np.uint8)
+        np.maximum(best, run, out=best)
+    return {
+        "sum": t.sum(axis=1, dtype=np.uint16),
+        "odd": (t & 1).sum(axis=1, dtype=np.uint8),
+        "run": best + 1,
+        "low": (t <= 22).sum(axis=1, dtype=np.uint8),
+        "decades": ((np.diff(t // 10, axis=1) != 0).sum(axis=1) + 1).astype(np.uint8),
+        "bits": np.bitwise_or.reduce(np.uint64(1) << t.astype(np.uint64), axis=1),
+    }
+
+
+def _numbers_to_bits(numbers):
+    bits = 0
+    for n in numbers:
+        bits |= 1 << n
+    return np.uint64(bits)
+
+
+def build_table(path=DEFAULT_DIR):
+    # 임시 폴더에 만든 뒤 이름을 바꿔서, 다른 프로세스가 반쯤 만든 표를 읽지 않게 함
+    parent = os.path.dirname(path)
+    os.makedirs(parent, exist_ok=True)
+    tmp = tempfile.mkdtemp(prefix=".building-", dir=parent)
+    try:
+        out = {
+            name: np.lib.format.open_memmap(
+                os.path.join(tmp, f"{name}.npy"), mode="w+", dtype=dtype, shape=(TOTAL,) + shape
+            )
+            for name, (dtype, shape) in COLUMNS.items()
+        }
+        for start in range(0, TOTAL, BUILD_CHUNK):
+            stop = min(start + BUILD_CHUNK, TOTAL)
+            tickets = unrank_tickets(np.arange(start, stop))
+            out["tickets"][start:stop] = tickets
+            for name, values in ticket_features(tickets).items():
+                out[name][start:stop] = values
+        for column in out.values():
+            column.flush()
+        del out
+        os.replace(tmp, path)
+    except OSError:
+        # 다른 프로세스가 먼저 만들어 둔 경우
+        if not os.path.isdir(path):
+            raise
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+class TicketTable:
+    def __init__(self, path=DEFAULT_DIR):
+        self.path = path
+        self.columns = {
+            name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r") for name in COLUMNS
+        }
+
+    @property
+    def tickets(self):
+        return self.columns["tickets"]
+
+    # 조건을 모두 만족하는 행 = True 인 마스크. 범위는 (최소, 최대) 양 끝 포함
+    def filter_mask(self, include=(), exclude=(), sum_range=None, odd_range=None,
+                    max_run=None, low_range=None, decade_range=None):
+        mask = np.ones(TOTAL, dtype=bool)
+        if include or exclude:
+            bits = self.columns["bits"]
+            if include:
+                inc = _numbers_to_bits(include)
+                mask &= (bits & inc) == inc
+            if exclude:
+                mask &= (bits & _numbers_to_bits(exclude)) == 0
+        for name, bounds in (("sum", sum_range), ("odd", odd_range),
+                             ("low", low_range), ("decades", decade_range)):
+            if bounds is not None:
+                col = self.columns[name]
+                mask &= (col >= bounds[0]) & (col <= bounds[1])
+        if max_run is not None:
+            mask &= self.columns["run"] <= max_run
+        return mask
+
+    # 마스크를 통과한 행(순번) 중에서 겹치지 않게 num_sets개를 뽑음
+    def sample(self, mask, num_sets, rng=None, seen=None):
+        if rng is None:
+            rng = np.random.default_rng()
+        ranks = np.flatnonzero(mask)
+        if seen is not None:
+            ranks = ranks[~seen.contains(ranks)]
+        if len(ranks) < num_sets:
+            raise ValueError("조건에 맞는 조합이 부족합니다.")
+        return rng.choice(ranks, num_sets, replace=False)
+
+
+# 표가 없으면 한 번 만들고 memmap으로 연다
+def load_table(path=DEFAULT_DIR):
+    if not os.path.isdir(path):
+        build_table(path)
+    return TicketTable(path)
@@ -1,4 +1,10 @@
 import streamlit as st
 
+from warmup import start_warm_up
+
+# 첫 방문 때 무거운 모듈(numpy, pandas, matplotlib)과 한글 글꼴을 백그라운드에서 미리 불러 둠
+# (서버 시작 전에 준비하려면: python warmup.py run main.py)
+start_warm_up()
+
 st.title('나의 첫 streamlit 프로젝트')
 st.write('hello streamlit!')
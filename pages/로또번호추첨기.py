@@ -1,16 +1,36 @@
 import streamlit as st
-import random
+import os
+import time
+import uuid
+import numpy as np
 import pandas as pd
 from datetime import datetime
 
+from lotto_draws import DEFAULT_PATH as DRAWS_PATH, SAMPLE_PATH, DrawFile
+from lotto_engine import (generate_lotto, generate_lotto_bulk, make_rng, make_seed_sequence, parse_numbers,
+                          parse_seed, validate_numbers)
+from lotto_export import PARQUET_AVAILABLE, HistoryExporter
+from lotto_history import HistoryPager, LottoHistory
+from lotto_rank import TicketSet, rank_tickets, sample_unique_ranks, unrank_tickets
+from lotto_parallel import generate_lotto_parallel, get_process_pool
+from lotto_stats import TicketStats
+from lotto_store import DEFAULT_DB_PATH, SQLiteHistory
+from lotto_simulation import MAX_SIM_PAIRS, exact_match_probabilities, simulate_matches
+from lotto_table import load_table
+from plot_utils import fig_to_png, managed_figure
+
 # 페이지 설정
 st.set_page_config(page_title="로또 번호 생성기", layout="centered")
 st.title("🎯 로또 번호 생성기 (대한민국 1~45 중 6개)")
 
 # 사이드바 설정
 st.sidebar.header("🔧 설정")
-num_sets = st.sidebar.number_input("생성할 세트 수", min_value=1, max_value=50, value=1)
+bulk_mode = st.sidebar.checkbox("대량 생성 모드 (최대 1,000,000세트)", value=False)
+max_sets = 1_000_000 if bulk_mode else 50
+num_sets = st.sidebar.number_input("생성할 세트 수", min_value=1, max_value=max_sets, value=1)
+parallel_mode = bulk_mode and st.sidebar.checkbox("여러 CPU 코어로 나눠 생성", value=True)
 sort_choice = st.sidebar.checkbox("각 세트 정렬하여 표시하기", value=True)
+unique_mode = st.sidebar.checkbox("히스토리와 겹치지 않는 세트만 생성", value=False)
 seed_input = st.sidebar.text_input("랜덤 시드 (선택)", value="")
 st.sidebar.markdown("---")
 st.sidebar.write("📋 포함/제외 숫자는 쉼표(,)로 구분하세요. 예: 3, 7, 21")
@@ -18,59 +38,76 @@ st.sidebar.write("📋 포함/제외 숫자는 쉼표(,)로 구분하세요. 예
 include_raw = st.sidebar.text_input("강제로 포함할 숫자 (선택)")
 exclude_raw = st.sidebar.text_input("제외할 숫자 (선택)")
 
-# 문자열을 숫자 리스트로 변환
-def parse_numbers(text):
-    if not text:
-        return []
-    nums = []
-    for part in text.split(","):
-        try:
-            n = int(part.strip())
-            if 1 <= n <= 45:
-                nums.append(n)
-        except:
-            continue
-    return sorted(set(nums))
+# 고급 필터: 전체 조합 표에서 조건에 맞는 조합만 골라 뽑기
+with st.sidebar.expander("🎛️ 고급 필터"):
+    use_filters = st.checkbox("고급 필터 사용", value=False)
+    sum_range = st.slider("번호 합계", 21, 255, (21, 255))
+    odd_range = st.slider("홀수 개수", 0, 6, (0, 6))
+    max_run = st.slider("최대 연속 번호 길이", 1, 6, 6)
+    low_range = st.slider("낮은 번호(1~22) 개수", 0, 6, (0, 6))
+    decade_range = st.slider("걸친 번호대 수 (1~9, 10~19, …)", 1, 5, (1, 5))
+filters = dict(sum_range=sum_range, odd_range=odd_range, max_run=max_run,
+               low_range=low_range, decade_range=decade_range)
 
 include_nums = parse_numbers(include_raw)
 exclude_nums = parse_numbers(exclude_raw)
 
 # 입력 검증
-if len(include_nums) > 6:
-    st.error("❌ 포함할 숫자는 최대 6개까지만 지정할 수 있습니다.")
+try:
+    validate_numbers(include_nums, exclude_nums)
+except ValueError as e:
+    st.error(f"❌ {e}")
     st.stop()
 
-if set(include_nums) & set(exclude_nums):
-    st.error("❌ 포함 숫자와 제외 숫자에 같은 값이 존재합니다.")
-    st.stop()
+# 전체 조합 표 (최초 1회 디스크에 만들고, 모든 세션이 memmap으로 공유)
+@st.cache_resource(show_spinner="전체 조합 표를 준비하는 중입니다 (최초 1회)...")
+def get_ticket_table():
+    return load_table()
 
-if len(exclude_nums) >= 45:
-    st.error("❌ 제외 숫자가 너무 많습니다.")
-    st.stop()
 
-# 시드 설정
-if seed_input.strip():
-    try:
-        seed_val = int(seed_input)
-    except:
-        seed_val = sum(ord(c) for c in seed_input)
-    random.seed(seed_val)
-
-# 번호 생성 함수
-def generate_lotto(include, exclude, sort_flag=True):
-    pool = [n for n in range(1, 46) if n not in exclude and n not in include]
-    need = 6 - len(include)
-    if len(pool) < need:
-        raise ValueError("조건에 맞는 번호를 생성할 수 없습니다.")
-    picked = random.sample(pool, need)
-    result = include + picked
-    if sort_flag:
-        result = sorted(result)
-    return result
+@st.cache_data(max_entries=64, show_spinner=False)
+def count_matches(include, exclude, filters):
+    return int(get_ticket_table().filter_mask(include, exclude, **filters).sum())
+
+
+if use_filters:
+    matches = count_matches(include_nums, exclude_nums, filters)
+    st.sidebar.caption(f"조건을 만족하는 조합: {matches:,}개")
+
+# 히스토리 저장소: LOTTO_HISTORY_DB가 지정되면 SQLite, 아니면 메모리
+def open_history():
+    if not DEFAULT_DB_PATH:
+        return LottoHistory()
+    # 주소창의 sid로 세션을 구분 → 새로고침해도 같은 기록을 이어서 사용
+    if "sid" not in st.query_params:
+        st.query_params["sid"] = uuid.uuid4().hex
+    return SQLiteHistory(DEFAULT_DB_PATH, st.query_params["sid"])
+
 
 # 세션 상태 초기화
 if "history" not in st.session_state:
-    st.session_state.history = []
+    st.session_state.history = open_history()
+    st.session_state.exporter = HistoryExporter(st.session_state.history)
+    st.session_state.pager = HistoryPager(st.session_state.history)
+    st.session_state.ticket_set = TicketSet()  # 히스토리에 나온 조합 (순번 비트셋)
+    st.session_state.stats = TicketStats()  # 번호 빈도 / 동시 출현 / 합계 / 홀짝 누적 통계
+    st.session_state.rng = make_rng()  # 시드가 없을 때 쓰는 이 세션만의 난수 스트림
+    # 저장된 기록을 이어서 쓰는 경우 비트셋과 통계도 다시 채움
+    for start in range(0, len(st.session_state.history), 100_000):
+        chunk = st.session_state.history.tickets_range(start, start + 100_000)
+        st.session_state.ticket_set.add(rank_tickets(chunk))
+        st.session_state.stats.add(chunk)
+
+# 이 세트 수 이상이면 여러 프로세스로 나눠 생성 (작업자 풀은 lotto_parallel에서 모든 세션이 공유)
+PARALLEL_THRESHOLD = 200_000
+
+
+# 시드 설정 (전역 random을 건드리지 않고 이 세션 전용 생성기를 만듦)
+seed_val = parse_seed(seed_input)
+if seed_val is not None:
+    rng = make_rng(seed_val)
+else:
+    rng = st.session_state.rng
 
 # 버튼
 col1, col2 = st.columns([3, 1])
@@ -78,14 +115,41 @@ col1, col2 = st.columns([3, 1])
 with col1:
     if st.button("✨ 로또 번호 생성하기"):
         try:
-            now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            for i in range(num_sets):
-                numbers = generate_lotto(include_nums, exclude_nums, sort_choice)
-                st.session_state.history.append({
-                    "time": now,
-                    "set": i + 1,
-                    "numbers": numbers
-                })
+            now = datetime.now()
+            if use_filters:
+                # 전체 조합 표에 필터 마스크를 씌우고 살아남은 순번 중에서 뽑기
+                seen = st.session_state.ticket_set if unique_mode else None
+                table = get_ticket_table()
+                mask = table.filter_mask(include_nums, exclude_nums, **filters)
+                ranks = table.sample(mask, num_sets, rng, seen)
+                tickets = table.tickets[ranks]
+                if not sort_choice:
+                    tickets = rng.permuted(tickets, axis=1)
+                st.session_state.ticket_set.add(ranks)
+            elif unique_mode:
+                # 조건을 만족하는 조합의 순번을 뽑고, 이미 나온 조합은 비트셋으로 걸러냄
+                ranks = sample_unique_ranks(num_sets, include_nums, exclude_nums, rng,
+                                            seen=st.session_state.ticket_set)
+                tickets = unrank_tickets(ranks)
+                if not sort_choice:
+                    tickets = rng.permuted(tickets, axis=1)
+            else:
+                if parallel_mode and num_sets >= PARALLEL_THRESHOLD:
+                    # 조각마다 자식 시드를 받아 여러 프로세스가 공유 메모리에 바로 기록
+                    seed_seq = make_seed_sequence(seed_val if seed_val is not None else int(rng.integers(2**63)))
+                    bar = st.progress(0.0, text="생성 중...")
+                    tickets = generate_lotto_parallel(
+                        num_sets, include_nums, exclude_nums, sort_choice, seed_seq, get_process_pool(),
+                        progress=lambda done, total: bar.progress(done / total, text=f"생성 중... {done:,}/{total:,}"),
+                    )
+                elif bulk_mode:
+                    # NumPy로 전체 세트를 한 번에 생성
+                    tickets = generate_lotto_bulk(num_sets, include_nums, exclude_nums, sort_choice, rng)
+                else:
+                    tickets = [generate_lotto(include_nums, exclude_nums, sort_choice, rng) for _ in range(num_sets)]
+                st.session_state.ticket_set.add(rank_tickets(tickets))
+            st.session_state.history.append(tickets, now)
+            st.session_state.stats.add(tickets)
             st.success(f"{num_sets}세트 생성 완료!")
             st.rerun()  # 최신 Streamlit 버전에서 지원됨
         except ValueError as e:
@@ -93,43 +157,242 @@ with col1:
 
 with col2:
     if st.button("🧹 히스토리 초기화"):
-        st.session_state.history = []
+        st.session_state.history.clear()
+        st.session_state.ticket_set.clear()
+        st.session_state.stats.clear()
+        st.session_state.pop("sim_result", None)
         st.success("히스토리 초기화 완료")
 
-# 최근 결과
+# 최근 결과 (대량 생성 시에도 표에는 최대 50세트만 표시)
+RECENT_LIMIT = 50
 st.subheader("📅 최근 생성 결과")
-if st.session_state.history:
-    recent = st.session_state.history[-num_sets:]
-    df_recent = pd.DataFrame([
-        {
-            "시간": r["time"],
-            "세트번호": r["set"],
-            "번호": ", ".join(map(str, r["numbers"]))
-        }
-        for r in reversed(recent)
-    ])
+history = st.session_state.history
+if len(history):
+    df_recent = st.session_state.pager.recent(min(num_sets, RECENT_LIMIT))
     st.table(df_recent)
 else:
     st.info("아직 생성된 번호가 없습니다. ‘로또 번호 생성하기’를 눌러보세요.")
 
 # 전체 히스토리
 st.subheader("📜 전체 생성 히스토리")
-if st.session_state.history:
-    df_all = pd.DataFrame([
-        {
-            "시간": h["time"],
-            "세트": h["set"],
-            **{f"번호{i+1}": (h["numbers"][i] if i < len(h["numbers"]) else "") for i in range(6)}
-        }
-        for h in st.session_state.history
-    ])
-    st.dataframe(df_all)
-
-    csv = df_all.to_csv(index=False).encode("utf-8-sig")
-    st.download_button("⬇️ CSV로 다운로드", csv, "lotto_history.csv", "text/csv")
+if len(history):
+    # 보이는 페이지만 잘라서 브라우저로 보냄
+    pager = st.session_state.pager
+    page_col1, page_col2 = st.columns(2)
+    page_size = page_col1.selectbox("페이지당 세트 수", [50, 100, 500, 1000], index=1)
+    num_pages = pager.num_pages(page_size)
+    page_no = min(page_col2.number_input("페이지", min_value=1, value=1, step=1), num_pages)
+    df_page = pager.page(page_no - 1, page_size)
+    st.dataframe(df_page)
+    st.caption(f"{page_no:,} / {num_pages:,} 페이지 · {df_page.index[0]:,}–{df_page.index[-1]:,}번째 세트")
+    storage = (
+        f"메모리 {history.nbytes / 1024:,.0f} KB" if isinstance(history, LottoHistory) else "SQLite에 저장됨"
+    )
+    st.caption(
+        f"저장된 세트: {len(history):,}개 (서로 다른 조합 {len(st.session_state.ticket_set):,}개) · {storage}"
+    )
+
+    # 내보낼 파일은 버튼을 눌렀을 때만 만들고, 히스토리가 그대로면 만든 것을 재사용
+    exporter = st.session_state.exporter
+    st.download_button("⬇️ CSV로 다운로드", exporter.csv_bytes, "lotto_history.csv", "text/csv")
+    if PARQUET_AVAILABLE:
+        st.download_button("⬇️ Parquet으로 다운로드 (대용량 분석용)", exporter.parquet_bytes,
+                           "lotto_history.parquet", "application/vnd.apache.parquet")
 else:
     st.write("히스토리가 비어 있습니다.")
 
+# 통계 (누적 집계값만으로 그림)
+def pair_heatmap_png(stats):
+    # 통계가 바뀌지 않았으면 이전에 그린 이미지를 재사용
+    cached = st.session_state.get("pair_heatmap")
+    if cached and cached[0] == stats.version:
+        return cached[1]
+    with managed_figure(figsize=(6, 5)) as (fig, ax):
+        image = ax.imshow(stats.pairs[1:, 1:], cmap="YlOrRd", extent=(0.5, 45.5, 45.5, 0.5))
+        ax.set_xticks(range(5, 46, 5))
+        ax.set_yticks(range(5, 46, 5))
+        fig.colorbar(image, ax=ax)
+        png = fig_to_png(fig, dpi=100)
+    st.session_state.pair_heatmap = (stats.version, png)
+    return png
+
+
+st.subheader("📊 번호 통계")
+stats = st.session_state.stats
+if stats.count:
+    freq_tab, pair_tab, sum_tab, odd_tab = st.tabs(["번호별 빈도", "함께 나온 번호", "합계 분포", "홀짝 비율"])
+    with freq_tab:
+        st.bar_chart(pd.DataFrame({"번호": range(1, 46), "횟수": stats.frequency[1:]}), x="번호", y="횟수")
+    with pair_tab:
+        st.caption("가로/세로 번호가 한 세트에 함께 나온 횟수")
+        st.image(pair_heatmap_png(stats))
+    with sum_tab:
+        # 합계 21~255를 5 단위 구간(21~25, …, 251~255)으로 묶어서 표시
+        sum_bins = stats.sums[21:256].reshape(-1, 5).sum(axis=1)
+        st.bar_chart(pd.DataFrame({"합계 구간": np.arange(21, 256, 5), "세트 수": sum_bins}), x="합계 구간", y="세트 수")
+    with odd_tab:
+        st.bar_chart(pd.DataFrame({"홀짝": [f"홀{k} 짝{6 - k}" for k in range(7)], "세트 수": stats.odd}), x="홀짝", y="세트 수")
+else:
+    st.write("번호를 먼저 생성해 주세요.")
+
+# 지난 회차 당첨번호 분석 (로컬 파일만 사용, 네트워크 필요 없음)
+SCORE_TICKET_LIMIT = 1000
+
+
+# 사용자 CSV 파일이면 추가한 회차를 파일에 저장 (예시 파일과 Parquet은 저장하지 않음)
+SAVE_DRAWS = DRAWS_PATH != SAMPLE_PATH and DRAWS_PATH.endswith(".csv")
+
+
+# 모든 세션이 공유하는 당첨번호 파일 (파일이 없으면 빈 기록, 다른 곳에서 바뀌면 새로 읽음)
+@st.cache_resource(show_spinner=False)
+def get_draw_file(path):
+    return DrawFile(path)
+
+
+# 파일에 저장되지 않는 회차는 이 세션의 사본에만 더함 (다른 세션의 분석에는 영향 없음)
+# 사본은 세션마다 한 번 만들고 이후 회차는 append로 이어 붙임. 원본이 새로 읽힌 경우에만 다시 만듦
+def session_draw_archive(base):
+    additions = st.session_state.get("draw_additions", [])
+    if not additions:
+        return base
+    forked = st.session_state.get("draw_archive")
+    if forked is None or forked[0] is not base:
+        archive = base.copy()
+        for draw in additions:
+            if not len(archive) or draw[0] > archive.rounds[-1]:
+                archive.append(*draw)
+        forked = st.session_state.draw_archive = (base, archive)
+    return forked[1]
+
+
+st.subheader("📈 지난 회차 당첨번호 분석")
+draw_file = get_draw_file(DRAWS_PATH)
+base_archive = draw_file.archive()
+archive = session_draw_archive(base_archive)
+if DRAWS_PATH == SAMPLE_PATH:
+    st.caption("⚠️ 기본 파일은 무작위로 만든 예시 데이터입니다. 실제 당첨번호 파일은 LOTTO_DRAWS_PATH로 지정하세요.")
+if len(archive):
+    st.write(f"{int(archive.rounds[0])}회 ~ {int(archive.rounds[-1])}회 · 총 {len(archive):,}회차")
+    if len(archive) > 1:
+        window = st.slider("핫/콜드 번호를 볼 최근 회차 수", 1, len(archive), min(50, len(archive)))
+    else:
+        window = len(archive)
+    order = np.argsort(archive.frequency(window), kind="stable")
+    hot_col, cold_col = st.columns(2)
+    hot_col.write("🔥 자주 나온 번호: " + ", ".join(str(n + 1) for n in order[::-1][:6]))
+    cold_col.write("🧊 적게 나온 번호: " + ", ".join(str(n + 1) for n in order[:6]))
+
+    gap_tab, pair_tab, score_tab = st.tabs(["미출현 회차 수", "자주 함께 나온 번호", "내 번호 채점"])
+    with gap_tab:
+        st.bar_chart(pd.DataFrame({"번호": range(1, 46), "미출현 회차 수": archive.gaps()}),
+                     x="번호", y="미출현 회차 수")
+    with pair_tab:
+        st.table(pd.DataFrame(archive.top_pairs(10), columns=["번호 A", "번호 B", "함께 나온 횟수"]))
+    with score_tab:
+        if len(history):
+            # 최근 생성한 세트를 지난 회차 전체와 한 번의 행렬 곱으로 비교
+            best, hits = archive.score_tickets(history.last_tickets(SCORE_TICKET_LIMIT))
+            st.caption(f"최근 {len(best):,}세트를 지난 {len(archive):,}회차와 비교한 최고 일치 개수")
+            st.table(pd.DataFrame({
+                "최고 일치 개수": [f"{m}개" for m in range(7)],
+                "세트 수": np.bincount(best, minlength=7),
+            }))
+            st.write(f"3개 이상 맞은 적이 있는 세트: {int((hits > 0).sum()):,}개")
+        else:
+            st.write("번호를 먼저 생성해 주세요.")
+
+with st.expander("➕ 새 회차 당첨번호 추가"):
+    if "draw_message" in st.session_state:
+        st.success(st.session_state.pop("draw_message"))
+    if not SAVE_DRAWS:
+        st.caption("추가한 회차는 이 세션의 분석에만 반영되고 파일에는 저장되지 않습니다. "
+                   "(저장하려면 LOTTO_DRAWS_PATH로 CSV 파일을 지정하세요)")
+    with st.form("draw_form"):
+        next_round = int(archive.rounds[-1]) + 1 if len(archive) else 1
+        draw_round = st.number_input("회차", min_value=1, value=next_round)
+        draw_date = st.date_input("추첨일")
+        draw_raw = st.text_input("당첨번호 6개 (쉼표로 구분)")
+        draw_bonus = st.number_input("보너스 번호", min_value=1, max_value=45, value=1)
+        draw_submitted = st.form_submit_button("추가")
+    if draw_submitted:
+        draw_nums = parse_numbers(draw_raw)
+        if len(draw_nums) != 6:
+            st.error("❌ 1~45 사이의 서로 다른 번호 6개를 입력하세요.")
+        elif draw_bonus in draw_nums:
+            st.error("❌ 보너스 번호는 당첨번호와 달라야 합니다.")
+        else:
+            draw = (draw_round, draw_date, draw_nums, draw_bonus)
+            try:
+                archive.check_round(draw_round)
+                if SAVE_DRAWS:
+                    # CSV 파일에 한 줄만 덧붙이고 공유 기록에도 이어 붙임 → 모든 세션에 바로 반영 (파일은 다시 읽지 않음)
+                    draw_file.append(*draw)
+                    message = f"{draw_round}회를 {os.path.basename(DRAWS_PATH)}에 저장했습니다."
+                else:
+                    st.session_state.setdefault("draw_additions", []).append(draw)
+                    if archive is not base_archive:
+                        archive.append(*draw)  # 이미 만든 이 세션의 사본에 이어 붙임
+                    message = f"{draw_round}회를 이 세션에 추가했습니다. (파일에는 저장되지 않음)"
+            except ValueError as e:
+                st.error(f"❌ {e}")
+            else:
+                st.session_state.draw_message = message
+                st.rerun()
+
+# 당첨 확률 시뮬레이션
+SIM_TICKET_LIMIT = 1000
+SIM_DRAW_OPTIONS = [100_000, 1_000_000, 10_000_000, 100_000_000]
+
+
+def format_odds(p):
+    return f"1 / {1 / p:,.0f}" if p > 0 else "—"
+
+
+def match_table(counts, pairs):
+    exact = exact_match_probabilities()
+    return pd.DataFrame({
+        "일치 개수": [f"{m}개" for m in range(3, 7)],
+        "모의 횟수": [f"{counts[m]:,}" for m in range(3, 7)],
+        "모의 확률": [format_odds(counts[m] / pairs) for m in range(3, 7)],
+        "이론 확률": [format_odds(exact[m]) for m in range(3, 7)],
+    })
+
+
+st.subheader("🎲 당첨 확률 시뮬레이션")
+if len(history):
+    sim_tickets = history.last_tickets(SIM_TICKET_LIMIT)
+    # 세트 수 × 추첨 수가 상한을 넘는 횟수는 고를 수 없게 함
+    max_draws = MAX_SIM_PAIRS // len(sim_tickets)
+    sim_draws = st.select_slider(
+        "모의 추첨 횟수",
+        options=[n for n in SIM_DRAW_OPTIONS if n <= max_draws],
+        value=1_000_000,
+        format_func=lambda n: f"{n:,}",
+    )
+    st.caption(f"최근 {len(sim_tickets):,}세트 각각에 대해 모의 추첨 결과와 맞힌 개수를 셉니다. "
+               f"(세트 수 × 추첨 수는 {MAX_SIM_PAIRS:,}까지)")
+    run_col, stop_col = st.columns([3, 1])
+    run_sim = run_col.button("▶️ 시뮬레이션 실행")
+    # 누르면 다시 실행되면서 진행 중인 시뮬레이션이 멈추고, 그때까지의 결과가 남음
+    stop_col.button("⏹️ 중지")
+    if run_sim:
+        # 조각마다 중간 결과를 바로 보여줘서 추정값이 수렴하는 모습을 볼 수 있게 함
+        bar = st.progress(0.0, text="모의 추첨 중...")
+        result = st.empty()
+        last_shown = 0.0
+        for done, counts in simulate_matches(sim_tickets, sim_draws, rng):
+            st.session_state.sim_result = (done, sim_draws, counts, len(sim_tickets))
+            if time.perf_counter() - last_shown > 0.3 or done == sim_draws:
+                last_shown = time.perf_counter()
+                bar.progress(done / sim_draws, text=f"모의 추첨 중... {done:,}/{sim_draws:,}")
+                result.table(match_table(counts, done * len(sim_tickets)))
+    elif "sim_result" in st.session_state:
+        done, total, counts, num_tickets = st.session_state.sim_result
+        st.caption(f"지난 시뮬레이션 ({'완료' if done == total else '중지됨'}): {done:,}/{total:,}회 모의 추첨")
+        st.table(match_table(counts, done * num_tickets))
+else:
+    st.write("번호를 먼저 생성해 주세요.")
+
 # 도움말
 st.markdown("---")
 st.markdown("### ℹ️ 사용 방법")
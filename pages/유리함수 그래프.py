@@ -1,7 +1,9 @@
 # app.py
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
+
+from rational_graph import animation_html, get_figure_cache, render_graph
+from viewport import view_controls, view_window
 
 # --- 페이지 기본 설정 ---
 st.set_page_config(page_title="유리함수 교과서 — y = k/x", layout="wide")
@@ -37,12 +39,11 @@ st.write("슬라이더로 k 값을 조절하며 그래프의 변화와 성질을
 # --- 슬라이더 설정 ---
 with st.sidebar:
     st.header("설정")
-    k = st.slider("k 값 (k ≠ 0)", -10.0, 10.0, 2.0, 0.1)
-    if abs(k) < 1e-9:
-        k = 0.1  # 0 방지
     x_range = st.slider("x 범위 (대칭)", 5.0, 50.0, 10.0, 1.0)
     show_points = st.checkbox("대표 점 표시 (x = ±1, ±2)", value=True)
     show_table = st.checkbox("대표 값 표 보기", value=True)
+    animate = st.checkbox("▶️ k 애니메이션 (-10 → 10 재생)", value=False)
+    zoom_mode = st.checkbox("🔍 확대/이동 모드", value=False)
 
 # --- 개념 설명 ---
 st.markdown("<div class='explain-box'>", unsafe_allow_html=True)
@@ -85,57 +86,49 @@ st.markdown(
 )
 st.markdown("</div>", unsafe_allow_html=True)
 
-# --- 그래프 데이터 생성 ---
-x_min, x_max = -x_range, x_range
-x_left = np.linspace(x_min, -0.001, 1000)
-x_right = np.linspace(0.001, x_max, 1000)
-y_left = k / x_left
-y_right = k / x_right
-
-# --- Matplotlib 그래프 ---
-fig, ax = plt.subplots(figsize=(7, 7))
-
-# 함수 그래프
-ax.plot(x_left, y_left, 'b', label=f'y = {k:.2f}/x')
-ax.plot(x_right, y_right, 'b')
-
-# 점근선 (x=0, y=0)
-ax.axvline(0, color='gray', linestyle='--', linewidth=1)
-ax.axhline(0, color='gray', linestyle='--', linewidth=1)
-
-# 대칭선 (y=x, y=-x)
-xx = np.linspace(-x_range, x_range, 500)
-ax.plot(xx, xx, color='lightblue', linestyle=':', linewidth=1, label='y = x')
-ax.plot(xx, -xx, color='lightblue', linestyle=':', linewidth=1, label='y = -x')
-
-# 대표점 표시
-if show_points:
-    xs = np.array([1, -1, 2, -2])
-    ys = k / xs
-    ax.scatter(xs, ys, color='crimson', s=50, label='대표점')
-    for x, y in zip(xs, ys):
-        ax.text(x, y, f"({x:.0f},{y:.1f})", fontsize=10, ha='left', va='bottom')
-
-# 축 범위 및 비율
-ax.set_xlim(-x_range, x_range)
-ax.set_ylim(-x_range, x_range)
-ax.set_xlabel("x")
-ax.set_ylabel("y")
-ax.set_title(f"y = {k:.2f}/x  ｜  k의 부호: {'+' if k>0 else '-'}  ｜  |k| = {abs(k):.2f}")
-ax.legend(loc="upper right")
-ax.grid(True, linestyle=':')
-
-st.pyplot(fig)
-
-# --- 대표값 표 출력 ---
-if show_table:
-    st.subheader("대표 값 (예시)")
-    xs_table = np.array([1, -1, 2, -2])
-    ys_table = k / xs_table
-    st.table({
-        "x": [f"{x:.1f}" for x in xs_table],
-        "y = k/x": [f"{y:.4f}" for y in ys_table],
-    })
+# --- 그래프 영역 ---
+# k 슬라이더를 움직이면 이 함수만 다시 실행되고, 위아래의 설명과 스타일은 다시 그리지 않음
+@st.fragment
+def graph_section(x_range, show_points, show_table, animate, zoom_mode):
+    if animate:
+        st.iframe(animation_html(x_range), height=530)
+        return
+
+    k = st.slider("k 값 (k ≠ 0)", -10.0, 10.0, 2.0, 0.1)
+    if abs(k) < 1e-9:
+        k = 0.1  # 0 방지
+
+    # 확대/이동 모드: 버튼으로 창을 옮기고, 좌우로 옮기거나 확대하면 곡선을 따라 위아래도 맞춤
+    view = None
+    if zoom_mode:
+        view = view_controls("rational_view", (x_range, x_range), follow=lambda x: k / x)
+        (x_min, x_max), (y_min, y_max) = view_window((x_range, x_range), view)
+        st.caption(f"확대 ×{2 ** view[0]:,} · x: {x_min:.6g} ~ {x_max:.6g} · y: {y_min:.6g} ~ {y_max:.6g}")
+
+    # 같은 (k, x 범위, 대표점, 보기) 조합이면 저장된 이미지를 그대로 사용
+    fig_cache = get_figure_cache()
+    graph_key = (round(k, 4), x_range, show_points, view)
+    st.image(fig_cache.get_or_render(graph_key, lambda: render_graph(k, x_range, show_points, view)))
+
+    # 캐시 크기 조정을 위한 적중/미스 현황
+    stats = fig_cache.stats()
+    st.caption(
+        f"🗂️ 그래프 캐시: 적중 {stats['hits']} · 미스 {stats['misses']} "
+        f"({stats['hit_rate']:.0%}) · {stats['items']}장 / {stats['bytes'] / 1024:.0f} KB"
+    )
+
+    # --- 대표값 표 출력 ---
+    if show_table:
+        st.subheader("대표 값 (예시)")
+        xs_table = np.array([1, -1, 2, -2])
+        ys_table = k / xs_table
+        st.table({
+            "x": [f"{x:.1f}" for x in xs_table],
+            "y = k/x": [f"{y:.4f}" for y in ys_table],
+        })
+
+
+graph_section(x_range, show_points, show_table, animate, zoom_mode)
 
 # --- 요약 정리 ---
 st.markdown("---")
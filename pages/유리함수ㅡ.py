@@ -1,6 +1,9 @@
 import streamlit as st
-import pandas as pd
 import numpy as np
+import pandas as pd
+
+from plot_utils import WarmCache
+from sampling import sample_rational
 
 # 페이지 기본 설정
 st.set_page_config(page_title="유리함수 y=k/x 교과서", layout="centered", page_icon="📘")
@@ -48,20 +51,33 @@ st.write("""
 k = st.slider("k 값을 조절해보세요", -5.0, 5.0, 1.0, 0.5)
 
 # 데이터 생성
-x1 = np.linspace(-10, -0.1, 200)
-x2 = np.linspace(0.1, 10, 200)
-y1 = k / x1
-y2 = k / x2
+# 두 가지를 한 번에 표본화: 휘는 곳에 점을 몰아 배치하고, y는 -10~10 범위로 자르며,
+# 점근선 x=0 자리에는 NaN 한 줄을 넣어 두 가지가 이어지지 않게 함 → 그래프 하나로 표시
+N_POINTS = 300
 
-# 데이터프레임 생성 (Streamlit 기본 그래프용)
-df1 = pd.DataFrame({"x": x1, "y": y1})
-df2 = pd.DataFrame({"x": x2, "y": y2})
+# k 슬라이더는 -5~5, 0.5 간격이라 가능한 값이 21개뿐이므로 처음 한 번 전부 미리 계산 (모든 세션이 공유)
+K_VALUES = [i / 2 for i in range(-10, 11)]
 
-st.markdown(f"### 📈 현재 그래프: y = {k}/x")
 
-# 그래프 출력 (st.line_chart은 한 번에 하나의 그래프만 표시 가능)
-st.line_chart(df1, x="x", y="y", height=400)
-st.line_chart(df2, x="x", y="y", height=400)
+@st.cache_resource
+def get_chart_cache():
+    # 21개 k 값의 (x, y)를 미리 잡아 둔 float32 배열 하나에 담고, k마다 그 한 줄을 DataFrame으로 씀
+    buffer = np.empty((len(K_VALUES), N_POINTS + 4, 2), dtype=np.float32)
+
+    def chart_data(k):
+        x, y = sample_rational(k, -10, 10, -10, 10, n=N_POINTS)
+        row = buffer[K_VALUES.index(k), :len(x)]
+        row[:, 0] = x
+        row[:, 1] = y
+        return pd.DataFrame(row, columns=["x", "y"], copy=False)
+
+    return WarmCache(chart_data, K_VALUES)
+
+
+df = get_chart_cache().get(k)
+
+st.markdown(f"### 📈 현재 그래프: y = {k}/x")
+st.line_chart(df, x="x", y="y", height=400)
 
 # 📘 그래프 성질 정리
 st.markdown("## 📘 그래프의 성질 정리")
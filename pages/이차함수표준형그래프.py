@@ -1,7 +1,11 @@
 # app.py
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
+
+from animation import player_html, sweep
+from plot_utils import managed_figure
+from quadratic import vertex_form, visible_segments
+from viewport import VIEW_PIXELS, make_tile_cache, sample_view, view_controls, view_window
 
 # 페이지 설정
 st.set_page_config(page_title="이차함수 교과서: y = a x^2", layout="wide")
@@ -27,78 +31,131 @@ st.markdown(
 
 st.write("")  # 여백
 
+# --- a 애니메이션 ---
+# a = -5 ~ 5의 모든 프레임을 (a × x) 배열로 한 번에 계산 (모든 세션이 공유)
+@st.cache_data(show_spinner=False)
+def animation_html():
+    a_values = np.round(np.arange(-50, 51) / 10, 1)
+    x = np.linspace(-10, 10, 401)
+    frames = sweep(lambda a, x: vertex_form(x, a), a_values, x)
+    return player_html(x, a_values, frames, "y = {}x²", (-100, 100), height=420)
+
+
+# --- 확대/이동 보기 ---
+# 표본 타일 캐시 (모든 세션이 공유)
+@st.cache_resource
+def get_tile_cache():
+    return make_tile_cache()
+
+
 # --- 그래프와 설명 영역 ---
-col1, col2 = st.columns([2, 1])
-
-with col1:
-    st.subheader("그래프: $y = a x^2$")
-    # 사용자 입력: a 값
-    a = st.slider("a 값 (계수)", min_value=-5.0, max_value=5.0, value=1.0, step=0.1, format="%.1f")
-    show_family = st.checkbox("여러 a 값(파라볼라 가족)도 함께 보기", value=False)
-
-    # x 범위
-    x = np.linspace(-10, 10, 400)
-    fig, ax = plt.subplots(figsize=(7, 5))
-    # 메인 그래프
-    y = a * x**2
-    ax.plot(x, y, label=f"y = {a}x²", linewidth=3)
-
-    # 선택: 파라볼라 가족 (예: a = -4,-2,-1,0.5,1,2,4)
-    if show_family:
-        family_as = [-4, -2, -1, -0.5, 0.5, 1, 2, 4]
-        for fa in family_as:
-            if fa == a:
-                continue
-            ay = fa * x**2
-            ax.plot(x, ay, linewidth=1, alpha=0.6, label=f"a={fa}")
-
-    # 축, 레이블, 그리드
-    ax.axhline(0, color="gray", linewidth=0.8)
-    ax.axvline(0, color="gray", linewidth=0.8)
-    ax.set_xlim(-10, 10)
-    # y축 범위 자동 조정: 현재 a에 따라 적절히 보이도록
-    ymax = max(1, abs(a) * 10**2)
-    ax.set_ylim(-ymax, ymax)
-    ax.set_xlabel("x")
-    ax.set_ylabel("y")
-    ax.set_title(f"y = {a}x² (a = {a})")
-    ax.grid(True, linestyle='--', linewidth=0.5)
-    ax.legend(loc='upper right', fontsize='small')
-
-    # concavity annotation (볼록성 주석)
-    if a > 0:
-        concave_text = "a > 0 이므로 아래로 볼록 (∪)"
-        ax.text(0.02, 0.95, "아래로 볼록 (concave up)", transform=ax.transAxes,
-                fontsize=12, verticalalignment='top', bbox=dict(boxstyle="round", fc="white", alpha=0.6))
-    elif a < 0:
-        concave_text = "a < 0 이므로 위로 볼록 (∩)"
-        ax.text(0.02, 0.95, "위로 볼록 (concave down)", transform=ax.transAxes,
-                fontsize=12, verticalalignment='top', bbox=dict(boxstyle="round", fc="white", alpha=0.6))
-    else:
-        concave_text = "a = 0 이면 2차항이 사라져 직선 y = 0"
-        ax.text(0.02, 0.95, "a = 0 → 직선 y = 0", transform=ax.transAxes,
-                fontsize=12, verticalalignment='top', bbox=dict(boxstyle="round", fc="white", alpha=0.6))
-
-    st.pyplot(fig)
-
-with col2:
-    st.subheader("성질 요약")
-    st.markdown("""
-    - **함수 형태**: \(y = a x^2\)  
-      - \(a > 0\) 이면 **아래로 볼록** (곡선이 위로 열림, 최소값을 가짐)  
-      - \(a < 0\) 이면 **위로 볼록** (곡선이 아래로 열림, 최대값을 가짐)  
-      - \(a = 0\) 이면 2차항이 없어져서 직선(상수함수) 또는 \(y=0\)이 됨  
-    - **대칭축**: 항상 \(x = 0\) (y축)  
-    - **정점(vertex)**: 항상 원점 \((0,0)\) (단 계수 a에 의해 오르내림 없이 위치 동일)
-    """)
-    st.write("---")
-    st.subheader("직관적 설명")
-    if a > 0:
-        st.write("계수 a가 클수록(양수) 그래프가 더 '가늘어'지며, 작은 양수(예: 0.5)는 '넓게' 펼쳐집니다.")
-    elif a < 0:
-        st.write("음수일 때도 절댓값이 클수록 더 가늘고(급격히 증가/감소), 절댓값이 작을수록 넓게 퍼집니다.")
-    else:
-        st.write("a = 0 이면 2차항이 사라져 포물선이 아닌 선이 됩니다.")
+# a 슬라이더 / 가족 보기를 바꾸면 이 함수만 다시 실행 (배경 CSS와 아래 문제는 그대로)
+@st.fragment
+def graph_section():
+    col1, col2 = st.columns([2, 1])
+
+    with col1:
+        st.subheader("그래프: $y = a x^2$")
+        # 사용자 입력: a 값
+        a = st.slider("a 값 (계수)", min_value=-5.0, max_value=5.0, value=1.0, step=0.1, format="%.1f")
+        show_family = st.checkbox("여러 a 값(파라볼라 가족)도 함께 보기", value=False)
+        dense_family = show_family and st.checkbox("가족을 촘촘하게 (a = -5 ~ 5, 0.2 간격)", value=False)
+
+        animate = st.checkbox("▶️ a 애니메이션 (-5 → 5 재생)", value=False)
+
+        if animate:
+            # 모든 a 값의 프레임을 한 번에 보내고 브라우저에서 재생 (y 범위는 고정)
+            st.iframe(animation_html(), height=470)
+        else:
+            zoom_mode = st.checkbox("🔍 확대/이동 모드", value=False)
+            # 기본 창: x는 -10~10, y는 현재 a에 따라 적절히 보이도록 자동 조정
+            base = (10, max(1, abs(a) * 10**2))
+            if zoom_mode:
+                # 버튼으로 창을 옮기고, 지금 창에 맞춰 픽셀 수만큼 다시 표본화 (타일 단위로 캐시)
+                view = view_controls("quadratic_view", base, follow=lambda x: vertex_form(x, a))
+                window = view_window(base, view)
+                x_curve, y_curve = sample_view(get_tile_cache(), ("ax²", a), lambda x: vertex_form(x, a),
+                                               base, view, VIEW_PIXELS)
+                (x_min, x_max), (y_min, y_max) = window
+                st.caption(f"확대 ×{2 ** view[0]:,} · x: {x_min:.6g} ~ {x_max:.6g} · y: {y_min:.6g} ~ {y_max:.6g}")
+            else:
+                window = view_window(base, (0, 0, 0))
+                # 창 안에 보이는 부분에만 점 400개
+                segments, _ = visible_segments([a], 0, 0, *window, n=400)
+                x_curve, y_curve = segments[0][:, 0], segments[0][:, 1]
+
+            # 그림은 st.pyplot 출력 직후 정리 (pyplot 레지스트리에 쌓이지 않음)
+            with managed_figure(figsize=(7, 5)) as (fig, ax):
+                # 메인 그래프
+                ax.plot(x_curve, y_curve, label=f"y = {a}x²", linewidth=3)
+
+                # 선택: 파라볼라 가족 (예: a = -4,-2,-1,0.5,1,2,4)
+                # 가족 전체를 (곡선 수 × 점 수) 배열 하나로 계산해서 LineCollection 하나로 그림
+                if show_family:
+                    from matplotlib.collections import LineCollection
+                    from matplotlib.colors import Normalize
+
+                    if dense_family:
+                        family_as = np.round(np.arange(-25, 26) / 5, 1)
+                    else:
+                        family_as = np.array([-4, -2, -1, -0.5, 0.5, 1, 2, 4])
+                    family_as = family_as[family_as != a]
+                    segments, owner = visible_segments(family_as, 0, 0, *window)
+                    family = LineCollection(segments, array=family_as[owner], cmap="coolwarm",
+                                            norm=Normalize(-5, 5), linewidths=1, alpha=0.6)
+                    ax.add_collection(family)
+                    fig.colorbar(family, ax=ax, label="a (가족)")
+
+                # 축, 레이블, 그리드
+                ax.axhline(0, color="gray", linewidth=0.8)
+                ax.axvline(0, color="gray", linewidth=0.8)
+                ax.set_xlim(*window[0])
+                ax.set_ylim(*window[1])
+                if zoom_mode:
+                    ax.ticklabel_format(useOffset=False)
+                ax.set_xlabel("x")
+                ax.set_ylabel("y")
+                ax.set_title(f"y = {a}x² (a = {a})")
+                ax.grid(True, linestyle='--', linewidth=0.5)
+                ax.legend(loc='upper right', fontsize='small')
+
+                # concavity annotation (볼록성 주석)
+                if a > 0:
+                    concave_text = "a > 0 이므로 아래로 볼록 (∪)"
+                    ax.text(0.02, 0.95, "아래로 볼록 (concave up)", transform=ax.transAxes,
+                            fontsize=12, verticalalignment='top', bbox=dict(boxstyle="round", fc="white", alpha=0.6))
+                elif a < 0:
+                    concave_text = "a < 0 이므로 위로 볼록 (∩)"
+                    ax.text(0.02, 0.95, "위로 볼록 (concave down)", transform=ax.transAxes,
+                            fontsize=12, verticalalignment='top', bbox=dict(boxstyle="round", fc="white", alpha=0.6))
+                else:
+                    concave_text = "a = 0 이면 2차항이 사라져 직선 y = 0"
+                    ax.text(0.02, 0.95, "a = 0 → 직선 y = 0", transform=ax.transAxes,
+                            fontsize=12, verticalalignment='top', bbox=dict(boxstyle="round", fc="white", alpha=0.6))
+
+                st.pyplot(fig)
+
+    with col2:
+        st.subheader("성질 요약")
+        st.markdown("""
+        - **함수 형태**: \(y = a x^2\)  
+          - \(a > 0\) 이면 **아래로 볼록** (곡선이 위로 열림, 최소값을 가짐)  
+          - \(a < 0\) 이면 **위로 볼록** (곡선이 아래로 열림, 최대값을 가짐)  
+          - \(a = 0\) 이면 2차항이 없어져서 직선(상수함수) 또는 \(y=0\)이 됨  
+        - **대칭축**: 항상 \(x = 0\) (y축)  
+        - **정점(vertex)**: 항상 원점 \((0,0)\) (단 계수 a에 의해 오르내림 없이 위치 동일)
+        """)
+        st.write("---")
+        st.subheader("직관적 설명")
+        if a > 0:
+            st.write("계수 a가 클수록(양수) 그래프가 더 '가늘어'지며, 작은 양수(예: 0.5)는 '넓게' 펼쳐집니다.")
+        elif a < 0:
+            st.write("음수일 때도 절댓값이 클수록 더 가늘고(급격히 증가/감소), 절댓값이 작을수록 넓게 퍼집니다.")
+        else:
+            st.write("a = 0 이면 2차항이 사라져 포물선이 아닌 선이 됩니다.")
+
+
+graph_section()
 
 st.write("---")
 
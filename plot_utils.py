@@ -0,0 +1,140 @@
+# 그래프 페이지에서 함께 쓰는 도우미 모음
+# matplotlib은 실제로 그림을 그릴 때(managed_figure) 처음 import 하므로,
+# 캐시만 쓰는 페이지는 matplotlib을 불러오는 시간을 쓰지 않습니다.
+import io
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+
+
+# 렌더링된 그래프 이미지(PNG 바이트) 캐시
+# 같은 슬라이더 값으로 다시 들어오면 그림을 다시 그리지 않고 저장된 이미지를 돌려줍니다.
+# PNG가 아닌 값(표본 배열 등)도 sizeof로 크기를 재서 같은 방식으로 저장할 수 있습니다.
+class FigureCache:
+    def __init__(self, max_items=128, max_bytes=64 * 1024 * 1024, sizeof=len):
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self._items = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            png = self._items.get(key)
+            if png is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return png
+
+    def put(self, key, png):
+        # 한 장이 예산보다 크면 저장하지 않음
+        size = self.sizeof(png)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._items.pop(key, None)
+            if old is not None:
+                self._bytes -= self.sizeof(old)
+            self._items[key] = png
+            self._bytes += size
+            # 개수 / 용량 한도를 넘으면 가장 오래 안 쓴 것부터 제거
+            while len(self._items) > self.max_items or self._bytes > self.max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self._bytes -= self.sizeof(evicted)
+
+    def get_or_render(self, key, render):
+        png = self.get(key)
+        if png is None:
+            # 그리는 동안에는 잠금을 잡지 않음 (다른 세션이 기다리지 않도록)
+            png = render()
+            self.put(key, png)
+        return png
+
+    # 아직 없는 키의 그림을 백그라운드 스레드에서 미리 그려 둠 (render(key) → PNG 바이트)
+    def warm(self, keys, render):
+        def run():
+            for key in keys:
+                with self._lock:
+                    present = key in self._items
+                if not present:
+                    self.put(key, render(key))
+
+        thread = threading.Thread(target=run, name="figure-cache-warm", daemon=True)
+        thread.start()
+        return thread
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "items": len(self._items),
+                "bytes": self._bytes,
+            }
+
+
+# 슬라이더가 가질 수 있는 값이 몇 개로 정해져 있을 때, 모든 값의 결과를 미리 계산해 두는 캐시
+# 만들자마자 백그라운드 스레드가 keys를 차례로 계산하고, 그 전에 요청된 값은 그 자리에서 계산합니다.
+class WarmCache:
+    def __init__(self, compute, keys):
+        self._compute = compute
+        self._keys = list(keys)
+        self._values = {}
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._warm, name="warm-cache", daemon=True)
+        self._thread.start()
+
+    def _warm(self):
+        for key in self._keys:
+            self.get(key)
+
+    def get(self, key):
+        with self._lock:
+            if key in self._values:
+                return self._values[key]
+        value = self._compute(key)
+        with self._lock:
+            return self._values.setdefault(key, value)
+
+    # (계산된 개수, 미리 계산할 전체 개수)
+    def progress(self):
+        with self._lock:
+            return len(self._values), len(self._keys)
+
+
+# matplotlib Figure를 PNG 바이트로 변환 (st.pyplot과 같은 해상도)
+def fig_to_png(fig, dpi=200):
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=dpi, bbox_inches="tight")
+    return buf.getvalue()
+
+
+# pyplot 전역 레지스트리에 등록되지 않는 Figure를 만들고, 다 쓰면 확실히 정리
+# plt.subplots()는 닫지 않으면 서버가 살아 있는 동안 그림이 계속 쌓입니다.
+@contextmanager
+def managed_figure(figsize=(7, 5)):
+    from matplotlib.figure import Figure
+
+    from korean_font import setup_korean_font
+
+    setup_korean_font()  # 한글 글꼴은 첫 그림 전에 한 번만 등록됨
+    fig = Figure(figsize=figsize)
+    ax = fig.subplots()
+    try:
+        yield fig, ax
+    finally:
+        fig.clear()
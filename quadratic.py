@@ -0,0 +1,60 @@
+# 이차함수 y = a(x - p)² + q 계산 엔진
+# 여러 곡선(가족)을 (곡선 수 × 점 수) 배열 하나로 한 번에 계산하고,
+# 곡선마다 화면 창 안에 보이는 x 구간을 미리 구해서 그 구간에만 점을 배치합니다.
+# (창 밖으로 잘려 나갈 점을 계산하지 않으므로, 곡선이 가파를수록 보이는 부분이 더 촘촘해짐)
+import numpy as np
+
+
+def vertex_form(x, a, p=0.0, q=0.0):
+    return a * (x - p) ** 2 + q
+
+
+def _visible_intervals(a, p, q, x_min, x_max, y_min, y_max):
+    # d = x - p 라 두면 y_min <= a d² + q <= y_max  ⇔  d² ∈ [r_lo, r_hi]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r1 = (y_min - q) / a
+        r2 = (y_max - q) / a
+    r_lo = np.maximum(np.minimum(r1, r2), 0.0)
+    r_hi = np.maximum(r1, r2)
+    flat = a == 0
+    # a = 0 이면 직선 y = q → 창 안에 있을 때만 전체 x 구간
+    r_lo = np.where(flat, 0.0, r_lo)
+    r_hi = np.where(flat, np.where((y_min <= q) & (q <= y_max), np.inf, -1.0), r_hi)
+    seen = r_hi >= 0
+    d_lo = np.sqrt(r_lo)
+    d_hi = np.sqrt(np.where(seen, r_hi, 0.0))
+
+    # 꼭짓점이 창 안이면 (d_lo = 0) 한 구간, 아니면 꼭짓점 양쪽의 두 구간
+    joined = d_lo == 0
+    lo_d, hi_d = x_min - p, x_max - p
+    left = (np.maximum(-d_hi, lo_d), np.minimum(np.where(joined, d_hi, -d_lo), hi_d))
+    right = (np.maximum(d_lo, lo_d), np.minimum(d_hi, hi_d))
+    right_ok = seen & ~joined & (right[1] > right[0])
+    left_ok = seen & (left[1] > left[0])
+    return left, left_ok, right, right_ok
+
+
+def visible_segments(a_values, p, q, x_range, y_range, n=200):
+    """a_values 각각에 대해 y = a(x - p)² + q 중 창 안에 보이는 부분을 n개 점으로 표본화합니다.
+
+    (선분 배열 (S, n, 2), 각 선분이 몇 번째 곡선인지 (S,)) 를 돌려줍니다.
+    선분 배열은 LineCollection에 그대로 넣을 수 있습니다.
+    """
+    x_min, x_max = x_range
+    y_min, y_max = y_range
+    a = np.atleast_1d(np.asarray(a_values, dtype=float))
+    p = np.broadcast_to(np.asarray(p, dtype=float), a.shape)
+    q = np.broadcast_to(np.asarray(q, dtype=float), a.shape)
+    left, left_ok, right, right_ok = _visible_intervals(a, p, q, x_min, x_max, y_min, y_max)
+
+    # 보이는 구간마다 한 줄씩: 곡선 번호와 구간 [d0, d1]
+    owner = np.concatenate([np.flatnonzero(left_ok), np.flatnonzero(right_ok)])
+    d0 = np.concatenate([left[0][left_ok], right[0][right_ok]])
+    d1 = np.concatenate([left[1][left_ok], right[1][right_ok]])
+
+    # (구간 수 × n) 을 한 번에 계산
+    t = np.linspace(0.0, 1.0, n)
+    d = d0[:, None] + (d1 - d0)[:, None] * t[None, :]
+    x = d + p[owner][:, None]
+    y = np.clip(a[owner][:, None] * d**2 + q[owner][:, None], y_min, y_max)
+    return np.stack([x, y], axis=-1), owner
@@ -0,0 +1,86 @@
+# y = k/x 그래프 그리기와 캐시 (pages/유리함수.py, pages/유리함수 그래프.py가 함께 사용)
+# 두 페이지가 같은 캐시를 쓰므로 미리 그려 둔 첫 화면 그림도 어느 페이지에서나 바로 나옵니다.
+import numpy as np
+import streamlit as st
+
+from animation import player_html, sweep
+from plot_utils import FigureCache, fig_to_png, managed_figure
+from sampling import sample_rational
+from viewport import VIEW_PIXELS, make_tile_cache, sample_view, view_window
+
+# 그래프 이미지 캐시 (모든 세션과 두 페이지가 공유)
+# 첫 화면(기본 k=2, x 범위 10, 대표점 표시)과 슬라이더를 한두 칸 움직였을 때의 그림만 백그라운드에서
+# 미리 그려 두고, 나머지 k 값은 처음 요청될 때 그려서 캐시에 넣음
+DEFAULT_X_RANGE = 10.0
+WARM_K_VALUES = [2.0, 2.1, 1.9, 2.2, 1.8]
+
+
+@st.cache_resource
+def get_figure_cache():
+    cache = FigureCache(max_items=256, max_bytes=64 * 1024 * 1024)
+    cache.warm([(k, DEFAULT_X_RANGE, True, None) for k in WARM_K_VALUES], lambda key: render_graph(*key))
+    return cache
+
+
+# 확대/이동 보기에서 쓰는 표본 타일 캐시 (모든 세션이 공유)
+@st.cache_resource
+def get_tile_cache():
+    return make_tile_cache()
+
+
+def render_graph(k, x_range, show_points, view=None):
+    # --- 그래프 데이터 생성 (점근선 x=0에서 끊기고, 보이는 y 범위로 잘림) ---
+    if view is None:
+        (x_min, x_max), (y_min, y_max) = (-x_range, x_range), (-x_range, x_range)
+        x_curve, y_curve = sample_rational(k, x_min, x_max, y_min, y_max)
+    else:
+        # 확대/이동 보기: 지금 창에 맞춰 다시 표본화 (타일 단위로 캐시)
+        base = (x_range, x_range)
+        (x_min, x_max), (y_min, y_max) = view_window(base, view)
+        x_curve, y_curve = sample_view(get_tile_cache(), ("k/x", k), lambda x: k / x, base, view, VIEW_PIXELS)
+
+    # --- Matplotlib 그래프 (그린 뒤 바로 정리) ---
+    with managed_figure(figsize=(7, 7)) as (fig, ax):
+        # 함수 그래프
+        ax.plot(x_curve, y_curve, 'b', label=f'y = {k:.2f}/x')
+
+        # 점근선 (x=0, y=0)
+        ax.axvline(0, color='gray', linestyle='--', linewidth=1)
+        ax.axhline(0, color='gray', linestyle='--', linewidth=1)
+
+        # 대칭선 (y=x, y=-x)
+        xx = np.linspace(x_min, x_max, 500)
+        ax.plot(xx, xx, color='lightblue', linestyle=':', linewidth=1, label='y = x')
+        ax.plot(xx, -xx, color='lightblue', linestyle=':', linewidth=1, label='y = -x')
+
+        # 대표점 표시
+        if show_points:
+            xs = np.array([1, -1, 2, -2])
+            ys = k / xs
+            ax.scatter(xs, ys, color='crimson', s=50, label='대표점')
+            for x, y in zip(xs, ys):
+                ax.text(x, y, f"({x:.0f},{y:.1f})", fontsize=10, ha='left', va='bottom', clip_on=True)
+
+        # 축 범위 및 비율
+        ax.set_xlim(x_min, x_max)
+        ax.set_ylim(y_min, y_max)
+        ax.set_xlabel("x")
+        ax.set_ylabel("y")
+        ax.set_title(f"y = {k:.2f}/x  ｜  k의 부호: {'+' if k>0 else '-'}  ｜  |k| = {abs(k):.2f}")
+        if view is not None:
+            ax.ticklabel_format(useOffset=False)
+        ax.legend(loc="upper right")
+        ax.grid(True, linestyle=':')
+
+        return fig_to_png(fig)
+
+
+# k 애니메이션
+# k = -10 ~ 10의 모든 프레임을 (k × x) 배열로 한 번에 계산해서 한 번만 보내고, 재생은 브라우저에서 처리
+@st.cache_data(show_spinner=False)
+def animation_html(x_range):
+    ks = np.array([i / 10 for i in range(-100, 101) if i])
+    s = np.linspace(-1, 1, 401)
+    x = x_range * s * np.abs(s)  # 점근선 근처일수록 촘촘하게 (x = 0에서는 선이 끊김)
+    frames = sweep(lambda k, x: k / x, ks, x)
+    return player_html(x, ks, frames, "y = {}/x", (-x_range, x_range), height=480)
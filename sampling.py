@@ -0,0 +1,147 @@
+# 그래프용 표본점 배치 도우미
+# 고정 간격 linspace 대신, 곡선이 많이 휘는 곳(점근선 근처)에 점을 몰아주고
+# 평평한 꼬리 부분에는 적은 점만 씁니다.
+import numpy as np
+
+# 곡률(꺾이는 각도)에 주는 가중치 — 클수록 휘는 곳에 점이 더 몰림
+CURVATURE_WEIGHT = 0.5
+
+
+def _pole_cuts(f, xf, yf, poles):
+    # 점근선이 두 점 사이에 숨어 있는 선분 (|k|가 작으면 양옆 점이 모두 창 안이라 건너뜀으로는 못 찾음)
+    # 1) 알려진 극(pole)이 사이에 있는 선분
+    cut = np.zeros(len(xf) - 1, dtype=bool)
+    for p in poles:
+        cut |= (xf[:-1] < p) & (p < xf[1:])
+    # 2) 이웃한 두 점의 부호가 바뀌는데 가운데 값이 두 값 사이에 있지 않은 선분
+    #    (연속 함수가 0을 지나면 가운데 값은 두 값 사이에 있음)
+    flip = np.flatnonzero(np.sign(yf[:-1]) * np.sign(yf[1:]) < 0)
+    if len(flip):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ym = np.asarray(f((xf[flip] + xf[flip + 1]) / 2), dtype=float)
+        lo = np.minimum(yf[flip], yf[flip + 1])
+        hi = np.maximum(yf[flip], yf[flip + 1])
+        cut[flip[~((lo <= ym) & (ym <= hi))]] = True
+    return cut
+
+
+def _visible_runs(xf, yf, y_min, y_max, cut):
+    # 점근선 감지: 값이 무한/정의되지 않거나, 이웃한 두 점이 창 위/아래로 건너뛰거나, 사이에 극이 있는 곳
+    finite = np.isfinite(yf)
+    above = finite & (yf > y_max)
+    below = finite & (yf < y_min)
+    inside = finite & ~above & ~below
+    jump = (above[:-1] & below[1:]) | (below[:-1] & above[1:])
+    broken = jump | cut | ~finite[:-1] | ~finite[1:]
+
+    # 화면에 보이는 구간 (양 끝 중 하나라도 창 안에 있는 선분)
+    seg_ok = (inside[:-1] | inside[1:]) & ~broken
+    edges = np.diff(np.concatenate(([0], seg_ok.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    stops = np.flatnonzero(edges == -1)
+    return list(zip(starts, stops))
+
+
+def _snap_to_window(f, xs, ys, y_min, y_max, steps=30):
+    # 창 밖에 있는 양 끝점을 곡선이 창 경계와 만나는 자리로 당겨옴 (이분법)
+    for end, inner in ((0, 1), (-1, -2)):
+        if y_min <= ys[end] <= y_max:
+            continue
+        bound = y_max if ys[end] > y_max else y_min
+        lo, hi = xs[inner], xs[end]
+        for _ in range(steps):
+            mid = (lo + hi) / 2
+            with np.errstate(divide="ignore", invalid="ignore"):
+                y_mid = f(mid)
+            if y_min <= y_mid <= y_max:
+                lo = mid
+            else:
+                hi = mid
+        xs[end] = lo
+        ys[end] = bound
+
+
+def _extend_to_cut(f, x_in, x_cut, y_in, y_min, y_max, steps=30):
+    # 극 바로 옆에서 끊긴 끝점(창 안)을 극 쪽으로, 곡선이 창을 벗어나기 직전까지 늘림 (이분법)
+    lo, hi = x_in, x_cut
+    for _ in range(steps):
+        mid = (lo + hi) / 2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            y_mid = f(mid)
+        if np.isfinite(y_mid) and y_min <= y_mid <= y_max and np.sign(y_mid) * np.sign(y_in) >= 0:
+            lo = mid
+        else:
+            hi = mid
+    with np.errstate(divide="ignore", invalid="ignore"):
+        y = float(np.clip(f(lo), y_min, y_max))
+    return lo, y
+
+
+def _segment_weights(xf, yf, x_span, y_span):
+    # 화면 비율로 정규화한 선분 길이 + 꺾임 각도
+    dx = np.diff(xf) / x_span
+    dy = np.diff(yf) / y_span
+    length = np.hypot(dx, dy)
+    angle = np.arctan2(dy, dx)
+    turn = np.abs(np.diff(angle))
+    turn = np.concatenate(([0.0], turn)) + np.concatenate((turn, [0.0]))
+    return length + CURVATURE_WEIGHT * 0.5 * turn
+
+
+def sample_function(f, x_min, x_max, y_min, y_max, n=300, fine=4096, poles=()):
+    """f를 [x_min, x_max]에서 곡률에 맞춰 n개 내외의 점으로 표본화합니다.
+
+    y는 [y_min, y_max] 창 안으로 잘리고, 점근선이 있는 자리에는 NaN을 넣어
+    선이 이어지지 않게 합니다. poles에 알려진 점근선의 x 좌표를 주면 그 자리에서는 항상 끊습니다.
+    (x, y) 배열을 돌려줍니다.
+    """
+    xf = np.linspace(x_min, x_max, fine)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        yf = np.asarray(f(xf), dtype=float)
+
+    cut = _pole_cuts(f, xf, yf, poles)
+    runs = _visible_runs(xf, yf, y_min, y_max, cut)
+    if not runs:
+        return np.empty(0), np.empty(0)
+
+    x_span = x_max - x_min
+    y_span = y_max - y_min
+    pieces = []
+    for a, b in runs:
+        xs = xf[a:b + 1].copy()
+        ys = yf[a:b + 1].copy()
+        _snap_to_window(f, xs, ys, y_min, y_max)
+        # 극에서 끊긴 쪽 끝은 창 경계(또는 극 바로 옆)까지 이어 그림
+        if a > 0 and cut[a - 1]:
+            x0, y0 = _extend_to_cut(f, xs[0], xf[a - 1], ys[0], y_min, y_max)
+            xs, ys = np.concatenate(([x0], xs)), np.concatenate(([y0], ys))
+        if b < len(cut) and cut[b]:
+            x1, y1 = _extend_to_cut(f, xs[-1], xf[b + 1], ys[-1], y_min, y_max)
+            xs, ys = np.concatenate((xs, [x1])), np.concatenate((ys, [y1]))
+        w = _segment_weights(xs, ys, x_span, y_span)
+        if w.sum() > 0:  # 창 모서리에 한 점만 닿는 경우 등 길이 0인 조각은 버림
+            pieces.append((xs, np.concatenate(([0.0], np.cumsum(w)))))
+    if not pieces:
+        return np.empty(0), np.empty(0)
+
+    # 조각마다 가중치 총합에 비례해 점 개수를 나눔 (최소 2개)
+    totals = np.array([cdf[-1] for _, cdf in pieces])
+    counts = np.maximum(2, np.round(n * totals / totals.sum()).astype(int))
+
+    xs_out, ys_out = [], []
+    for i, ((xs, cdf), m) in enumerate(zip(pieces, counts)):
+        if i > 0:
+            # 점근선 자리에서 선을 끊음
+            xs_out.append([(xs_out[-1][-1] + xs[0]) / 2])
+            ys_out.append([np.nan])
+        x = np.interp(np.linspace(0.0, cdf[-1], m), cdf, xs)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            y = np.asarray(f(x), dtype=float)
+        xs_out.append(x)
+        ys_out.append(np.clip(y, y_min, y_max))
+    return np.concatenate(xs_out), np.concatenate(ys_out)
+
+
+def sample_rational(k, x_min, x_max, y_min, y_max, n=300):
+    # y = k/x 전용 (점근선 x = 0에서 항상 끊김)
+    return sample_function(lambda x: k / x, x_min, x_max, y_min, y_max, n, poles=(0.0,))
@@ -0,0 +1,75 @@
+import os
+
+import numpy as np
+import pytest
+
+import lotto_draws
+from lotto_draws import HEADER, DrawArchive, DrawFile, empty_draw_arrays, load_draw_arrays
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(lotto_draws, "CACHE_DIR", str(tmp_path / "cache"))
+    return tmp_path / "cache"
+
+
+def write_draws(path, rows):
+    lines = [HEADER] + [f"{r},2024-01-{r:02d},{r},{r + 1},{r + 2},{r + 3},{r + 4},{r + 5},45" for r in rows]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+# 머리글만 있는 파일, 빈 배열도 분석할 수 있음
+def test_empty_archive(tmp_path):
+    path = tmp_path / "draws.csv"
+    path.write_text(HEADER + "\n", encoding="utf-8")
+    for archive in (DrawArchive(load_draw_arrays(str(path))), DrawArchive(empty_draw_arrays())):
+        assert len(archive) == 0
+        assert archive.gaps().tolist() == [0] * 45
+        archive.append(1, "2024-01-06", [3, 1, 2, 4, 5, 6], 7)
+        assert archive.numbers.tolist() == [[1, 2, 3, 4, 5, 6]]
+        assert archive.gaps()[:6].tolist() == [0] * 6
+
+
+# 사본에 추가한 회차는 원본에 영향이 없음
+def test_copy_is_independent(tmp_path):
+    path = tmp_path / "draws.csv"
+    write_draws(path, [1, 2, 3])
+    base = DrawArchive(load_draw_arrays(str(path)))
+    fork = base.copy()
+    fork.append(4, "2024-02-01", [40, 41, 42, 43, 44, 45], 1)
+    assert len(base) == 3 and len(fork) == 4
+    assert base.stats.frequency[45] == 0 and fork.stats.frequency[45] == 1
+    assert base.gaps()[39] == 3 and fork.gaps()[39] == 0
+
+
+# 이 프로세스가 저장한 회차는 다시 읽지 않고 반영하고, 다른 곳에서 바뀐 파일만 새로 읽음
+def test_draw_file_appends_without_reparsing(tmp_path, monkeypatch, cache_dir):
+    path = tmp_path / "draws.csv"
+    write_draws(path, [1, 2])
+    loads = []
+    monkeypatch.setattr(lotto_draws, "load_draw_arrays",
+                        lambda p: loads.append(p) or load_draw_arrays(p))
+    draws = DrawFile(str(path))
+    archive = draws.archive()
+    draws.append(3, "2024-01-20", [9, 8, 7, 6, 5, 4], 1)
+    draws.append(4, "2024-01-27", [1, 2, 3, 4, 5, 6], 7)
+    with pytest.raises(ValueError):
+        draws.append(4, "2024-01-27", [1, 2, 3, 4, 5, 6], 7)
+    assert draws.archive() is archive and len(archive) == 4 and len(loads) == 1
+    assert DrawArchive(load_draw_arrays(str(path))).numbers.tolist() == archive.numbers.tolist()
+
+    write_draws(path, [1, 2, 3, 4, 5])
+    os.utime(path, ns=(0, 0))
+    assert len(draws.archive()) == 5 and len(loads) == 2
+    # 같은 파일의 예전 변환본은 지워짐
+    assert len(os.listdir(cache_dir)) == 1
+
+
+# 파일이 없으면 빈 기록으로 시작하고, 처음 저장할 때 머리글부터 씀
+def test_draw_file_missing(tmp_path):
+    path = tmp_path / "new.csv"
+    draws = DrawFile(str(path))
+    assert len(draws.archive()) == 0
+    draws.append(1, "2024-01-06", [1, 2, 3, 4, 5, 6], 7)
+    assert path.read_text(encoding="utf-8").splitlines() == [HEADER, "1,2024-01-06,1,2,3,4,5,6,7"]
+    assert np.array_equal(DrawFile(str(path)).archive().rounds, [1])
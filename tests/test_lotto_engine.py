@@ -0,0 +1,127 @@
+import os
+import random
+import sys
+import threading
+import types
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+from streamlit.testing.v1 import AppTest
+
+from lotto_engine import generate_lotto, generate_lotto_bulk, make_rng, make_seed_sequence, spawn_rngs
+import lotto_parallel
+from lotto_parallel import generate_lotto_parallel, make_process_pool
+
+SESSIONS = 32
+LOTTO_PAGE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "pages", "로또번호추첨기.py")
+
+
+# 한 세션이 하는 일: 자기 생성기로 한 세트씩 뽑기와 대량 생성을 번갈아 함
+def session_draws(seed, rounds=50, barrier=None):
+    rng = make_rng(seed)
+    out = []
+    for _ in range(rounds):
+        if barrier is not None:
+            barrier.wait()  # 모든 세션이 같은 순간에 생성기를 쓰도록 맞춤
+        out.append(generate_lotto([], [], True, rng))
+        out.extend(generate_lotto_bulk(20, [7], [1, 2, 3], True, rng).tolist())
+    return out
+
+
+# 동시에 돌아가는 세션마다 결과가 시드로만 정해지고, 서로의 상태에 영향을 주지 않아야 함
+def test_concurrent_sessions_are_reproducible_and_independent():
+    seeds = [i % 8 for i in range(SESSIONS)]  # 같은 시드를 쓰는 세션이 여럿 있도록
+    expected = {seed: session_draws(seed) for seed in set(seeds)}
+    global_state = random.getstate(), np.random.get_state()[1].copy()
+
+    barrier = threading.Barrier(SESSIONS)
+    with ThreadPoolExecutor(SESSIONS) as pool:
+        results = list(pool.map(lambda seed: session_draws(seed, barrier=barrier), seeds))
+
+    for seed, result in zip(seeds, results):
+        assert result == expected[seed]
+    assert len({str(expected[seed]) for seed in expected}) == len(expected)
+    # 전역 random / np.random은 건드리지 않음
+    assert random.getstate() == global_state[0]
+    assert np.array_equal(np.random.get_state()[1], global_state[1])
+
+
+def test_spawned_streams_are_reproducible_and_distinct():
+    first = [rng.integers(2**63, size=4).tolist() for rng in spawn_rngs(make_seed_sequence(123), 8)]
+    again = [rng.integers(2**63, size=4).tolist() for rng in spawn_rngs(make_seed_sequence(123), 8)]
+    assert first == again
+    assert len({str(stream) for stream in first}) == 8
+
+
+# 여러 세션이 동시에 같은 작업자 풀로 병렬 생성해도, 같은 시드면 같은 결과
+def test_parallel_generation_under_concurrent_sessions():
+    pool = make_process_pool(2)
+    try:
+        def run(seed):
+            return generate_lotto_parallel(20_000, [], [45], True, make_seed_sequence(seed), pool,
+                                           shard_size=5_000)
+
+        with ThreadPoolExecutor(8) as sessions:
+            results = list(sessions.map(run, [1, 2, 1, 2, 1, 2, 3, 3]))
+    finally:
+        pool.shutdown()
+    assert np.array_equal(results[0], results[2]) and np.array_equal(results[0], results[4])
+    assert np.array_equal(results[1], results[3]) and np.array_equal(results[6], results[7])
+    assert not np.array_equal(results[0], results[1])
+    assert not (np.stack(results) == 45).any()
+
+
+# 작업자 프로세스는 부모의 __main__(Streamlit에서는 실행 중인 페이지)을 다시 실행하지 않음
+def test_parallel_workers_do_not_run_main(tmp_path, monkeypatch):
+    marker = tmp_path / "ran"
+    script = tmp_path / "page.py"
+    script.write_text(f"open({str(marker)!r}, 'w').close()\n")
+    page = types.ModuleType("__main__")
+    page.__file__ = str(script)
+    monkeypatch.setitem(sys.modules, "__main__", page)
+    pool = make_process_pool(2)
+    try:
+        tickets = generate_lotto_parallel(10_000, [], [], True, make_seed_sequence(1), pool, shard_size=2_500)
+    finally:
+        pool.shutdown()
+    assert tickets.shape == (10_000, 6)
+    assert not marker.exists()
+    assert sys.modules["__main__"] is page
+
+
+# 최근 결과 표의 번호 열 (생성 시각 열은 세션마다 다르므로 뺌)
+def recent_tickets(at):
+    return at.table[0].value.iloc[:, -1].tolist()
+
+
+# 페이지 세션 여러 개: 시드를 준 세션의 결과는 다른 세션이 무엇을 하든 같음
+def test_page_sessions_do_not_share_rng_state():
+    def session(seed=""):
+        at = AppTest.from_file(LOTTO_PAGE, default_timeout=120).run()
+        at.sidebar.number_input[0].set_value(5)
+        at.sidebar.text_input[0].set_value(seed)
+        return at
+
+    seeded, other, fresh = session("42"), session(), session("42")
+    seeded.button[0].click().run()
+    first = recent_tickets(seeded)
+    for _ in range(3):
+        other.button[0].click().run()
+    seeded.button[0].click().run()
+    fresh.button[0].click().run()
+    assert recent_tickets(seeded) == first
+    assert recent_tickets(fresh) == first
+    assert recent_tickets(other) != first
+
+
+# 페이지에서 병렬 생성 기준(PARALLEL_THRESHOLD)을 넘기면 공유 작업자 풀로 생성
+def test_page_parallel_generation():
+    at = AppTest.from_file(LOTTO_PAGE, default_timeout=300).run()
+    next(c for c in at.sidebar.checkbox if c.label.startswith("대량 생성 모드")).check().run()
+    at.sidebar.number_input[0].set_value(200_000)
+    at.sidebar.text_input[0].set_value("7")
+    at.button[0].click().run()
+    assert not at.exception
+    assert len(at.session_state.history) == 200_000
+    assert lotto_parallel._pool is not None
@@ -0,0 +1,74 @@
+import io
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import lotto_export
+from lotto_export import CSV_ENCODING, HistoryExporter
+from lotto_history import HistoryPager, LottoHistory
+
+
+def make_history(batches=(3, 5, 2), seed=0):
+    rng = np.random.default_rng(seed)
+    history = LottoHistory(capacity=4)
+    for i, n in enumerate(batches):
+        history.append(rng.integers(1, 46, size=(n, 6)), datetime(2024, 1, 1, 12, i))
+    return history
+
+
+# 배치마다 세트 번호가 1부터 다시 시작하고, 용량을 넘겨도 앞의 기록이 그대로 남음
+def test_history_append_and_set_numbers():
+    history = make_history()
+    assert len(history) == 10
+    assert history.set_numbers().tolist() == [1, 2, 3, 1, 2, 3, 4, 5, 1, 2]
+    assert history.batches.tolist() == [0] * 3 + [1] * 5 + [2] * 2
+    frame = history.to_frame()
+    assert np.array_equal(frame.iloc[:, 2:].to_numpy(), history.tickets)
+
+
+# 꽉 찬 페이지는 캐시되고, 마지막 (덜 찬) 페이지는 추가된 세트를 반영하며, 초기화하면 새로 만듦
+def test_pager_pages():
+    history = make_history()
+    pager = HistoryPager(history)
+    assert pager.num_pages(4) == 3
+    first = pager.page(0, 4)
+    assert first.index.tolist() == [1, 2, 3, 4]
+    assert pager.page(0, 4) is first
+    assert len(pager.page(2, 4)) == 2
+    history.append(np.full((1, 6), 9))
+    assert pager.page(0, 4) is first
+    assert len(pager.page(2, 4)) == 3
+    assert pager.page(2, 4).iloc[-1, 2:].tolist() == [9] * 6
+
+    history.clear()
+    history.append(np.full((4, 6), 1))
+    page = pager.page(0, 4)
+    assert page is not first
+    assert (page.iloc[:, 2:] == 1).all().all()
+
+
+# 새로 추가된 행만 이어 붙인 CSV가 전체를 한 번에 쓴 CSV와 같음 (초기화 뒤에도)
+def test_incremental_csv_matches_full_export(monkeypatch):
+    monkeypatch.setattr(lotto_export, "EXPORT_CHUNK", 3)
+    history = make_history()
+    exporter = HistoryExporter(history)
+
+    def full():
+        return history.to_frame().to_csv(index=False).encode(CSV_ENCODING)
+
+    assert exporter.csv_bytes() == full()
+    for n in (1, 4, 7):
+        history.append(np.full((n, 6), n))
+        assert exporter.csv_bytes() == full()
+    history.clear()
+    history.append(np.full((2, 6), 5))
+    assert exporter.csv_bytes() == full()
+
+
+def test_parquet_round_trip():
+    pytest.importorskip("pyarrow")
+    history = make_history((4, 6))
+    frame = pd.read_parquet(io.BytesIO(HistoryExporter(history).parquet_bytes()))
+    pd.testing.assert_frame_equal(frame, history.to_frame(), check_dtype=False)
@@ -0,0 +1,69 @@
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from lotto_rank import TOTAL, TicketSet, iter_unique_ranks, rank_tickets, sample_unique_ranks, unrank_tickets
+
+
+# 순번 ↔ 세트 변환은 전체 순번 공간에서 서로의 역함수
+def test_rank_unrank_round_trip():
+    ranks = np.concatenate([np.arange(1000), np.arange(0, TOTAL, 9973), np.arange(TOTAL - 1000, TOTAL)])
+    tickets = unrank_tickets(ranks)
+    assert tickets.dtype == np.uint8
+    assert np.array_equal(rank_tickets(tickets), ranks)
+    assert (np.diff(tickets.astype(int), axis=1) > 0).all()
+    assert tickets.min() >= 1 and tickets.max() <= 45
+
+
+# 정렬 여부와 상관없이 같은 세트는 같은 순번, 끝 세트는 0과 TOTAL - 1
+def test_rank_is_order_independent():
+    rng = np.random.default_rng(0)
+    tickets = np.array([rng.choice(np.arange(1, 46), 6, replace=False) for _ in range(500)])
+    ranks = rank_tickets(tickets)
+    assert np.array_equal(ranks, rank_tickets(np.sort(tickets, axis=1)))
+    assert np.array_equal(unrank_tickets(ranks), np.sort(tickets, axis=1))
+    assert rank_tickets([[1, 2, 3, 4, 5, 6], [45, 44, 43, 42, 41, 40]]).tolist() == [0, TOTAL - 1]
+
+
+# 비트셋은 중복 없이 세고, 초기화하면 비워짐
+def test_ticket_set():
+    seen = TicketSet()
+    seen.add([0, 5, 5, TOTAL - 1])
+    assert len(seen) == 3
+    assert seen.contains([0, 1, 5, TOTAL - 1]).tolist() == [True, False, True, True]
+    seen.add([5, 6])
+    assert len(seen) == 4
+    seen.clear()
+    assert len(seen) == 0
+    assert not seen.contains([0, 5, 6, TOTAL - 1]).any()
+
+
+# 조건 공간이 작으면 전부 펼쳐서 뽑고, 모자라면 오류
+def test_sample_unique_ranks_small_space():
+    seen = TicketSet()
+    ranks = sample_unique_ranks(30, [1, 2, 3, 4, 5], [], np.random.default_rng(0), seen)
+    tickets = unrank_tickets(ranks)
+    assert len(set(ranks.tolist())) == 30 and (tickets[:, :5] == [1, 2, 3, 4, 5]).all()
+    assert len(sample_unique_ranks(10, [1, 2, 3, 4, 5], [], np.random.default_rng(0), seen)) == 10
+    with pytest.raises(ValueError):
+        sample_unique_ranks(1, [1, 2, 3, 4, 5], [], np.random.default_rng(0), seen)
+
+
+# comb(45, 6)에 거의 다다르는 한 번의 실행: 모두 서로 다르고, 나머지 공간은 한 번만 펼침
+def test_iter_unique_ranks_near_exhaustion():
+    num_sets = TOTAL - 45_060
+    tracemalloc.start()
+    try:
+        seen = TicketSet()
+        sizes = []
+        for ranks in iter_unique_ranks(num_sets, [], [], np.random.default_rng(3), batch_size=1_000_000):
+            assert not seen.contains(ranks).any()
+            seen.add(ranks)
+            sizes.append(len(ranks))
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    assert len(seen) == num_sets and max(sizes) == 1_000_000
+    # 공간 전체(int32 순번) 몇 벌 수준이어야 함 — 배치마다 전체를 int64 (N, 6)으로 펼치면 수 GB
+    assert peak < 256 * 1024 * 1024
@@ -0,0 +1,27 @@
+import numpy as np
+
+from lotto_stats import TicketStats
+
+
+# 초기화한 뒤 다시 추가해도 예전 버전 번호가 돌아오지 않음 (버전으로 캐시한 그림이 되살아나지 않게)
+def test_version_never_repeats_after_clear():
+    stats = TicketStats()
+    stats.add([[1, 2, 3, 4, 5, 6]])
+    before = stats.version
+    stats.clear()
+    assert stats.count == 0 and not stats.pairs.any()
+    stats.add([[40, 41, 42, 43, 44, 45]])
+    assert stats.version > before
+    assert stats.pairs[44, 45] == 1 and stats.pairs[1, 2] == 0
+
+
+# 합계는 21~255 범위에 모두 들어가고 (255 포함), 번호 쌍은 대칭으로 셈
+def test_counts():
+    stats = TicketStats()
+    stats.add(np.array([[1, 2, 3, 4, 5, 6], [40, 41, 42, 43, 44, 45], [1, 3, 5, 7, 9, 45]]))
+    assert stats.count == 3
+    assert stats.sums[[21, 255, 70]].tolist() == [1, 1, 1]
+    assert stats.sums[21:256].reshape(-1, 5).sum() == 3
+    assert stats.frequency[1] == 2 and stats.frequency[45] == 2
+    assert np.array_equal(stats.pairs, stats.pairs.T) and stats.pairs.sum() == 3 * 15 * 2
+    assert stats.odd.tolist() == [0, 0, 0, 2, 0, 0, 1]
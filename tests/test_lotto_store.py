@@ -0,0 +1,18 @@
+import numpy as np
+
+from lotto_store import SQLiteHistory
+
+
+# 같은 sid를 연 두 탭(연결)이 번갈아 저장해도 순서가 겹치지 않고, 둘 다 전체 기록을 봄
+def test_two_connections_same_session(tmp_path):
+    path = str(tmp_path / "history.db")
+    first, second = SQLiteHistory(path, "sid"), SQLiteHistory(path, "sid")
+    first.append(np.full((3, 6), 1))
+    second.append(np.full((2, 6), 2))
+    first.append(np.full((1, 6), 3))
+    assert len(first) == 6
+    assert first.tickets_range()[:, 0].tolist() == [1, 1, 1, 2, 2, 3]
+    assert first.to_frame()["세트"].tolist() == [1, 2, 3, 1, 2, 1]
+    reopened = SQLiteHistory(path, "sid")
+    assert len(reopened) == 6 and reopened._batches == 3
+    assert len(SQLiteHistory(path, "other")) == 0
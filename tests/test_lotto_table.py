@@ -0,0 +1,53 @@
+import os
+
+import numpy as np
+import pytest
+
+from lotto_rank import TOTAL, TicketSet, unrank_tickets
+from lotto_table import load_table, ticket_features
+
+
+# 표를 한 번 만들어 두고 이 파일의 테스트가 함께 씀 (약 130MB)
+@pytest.fixture(scope="module")
+def table(tmp_path_factory):
+    return load_table(str(tmp_path_factory.mktemp("table") / "lotto_table"))
+
+
+# 열은 memmap으로 열리고, 행 번호 = 순번
+def test_table_is_memmapped_by_rank(table):
+    assert isinstance(table.tickets, np.memmap)
+    assert table.tickets.shape == (TOTAL, 6)
+    ranks = np.arange(0, TOTAL, 104_729)
+    assert np.array_equal(table.tickets[ranks], unrank_tickets(ranks))
+    for name, values in ticket_features(unrank_tickets(ranks)).items():
+        assert np.array_equal(table.columns[name][ranks], values)
+
+
+# 이미 만든 표는 다시 만들지 않고 그대로 엶
+def test_load_table_reuses_files(table):
+    path = os.path.join(table.path, "tickets.npy")
+    mtime = os.stat(path).st_mtime_ns
+    again = load_table(table.path)
+    assert os.stat(path).st_mtime_ns == mtime
+    assert np.array_equal(again.tickets[-3:], table.tickets[-3:])
+
+
+# 필터 마스크를 통과한 세트는 모든 조건을 만족하고, 뽑기는 이미 나온 세트를 피함
+def test_filter_and_sample(table):
+    mask = table.filter_mask([7], [1, 2, 3], sum_range=(100, 140), odd_range=(2, 4), max_run=2)
+    picked = table.tickets[mask]
+    assert len(picked)
+    assert (picked == 7).any(axis=1).all()
+    assert not np.isin(picked, [1, 2, 3]).any()
+    sums = picked.sum(axis=1, dtype=int)
+    assert sums.min() >= 100 and sums.max() <= 140
+    odd = (picked & 1).sum(axis=1)
+    assert odd.min() >= 2 and odd.max() <= 4
+
+    seen = TicketSet()
+    seen.add(np.flatnonzero(mask)[::2])
+    ranks = table.sample(mask, 100, np.random.default_rng(1), seen)
+    assert len(set(ranks.tolist())) == 100
+    assert mask[ranks].all() and not seen.contains(ranks).any()
+    with pytest.raises(ValueError):
+        table.sample(mask, int(mask.sum()), np.random.default_rng(1), seen)
@@ -0,0 +1,65 @@
+import gc
+import resource
+import tracemalloc
+
+import matplotlib
+import numpy as np
+
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt  # noqa: E402
+
+from plot_utils import fig_to_png, managed_figure  # noqa: E402
+
+RERUNS = 10_000
+X = np.linspace(-10, 10, 300)
+
+
+# 페이지가 재실행마다 하는 일: 그림 하나를 만들어 그리고 정리
+def rerun(k, png=False):
+    with managed_figure() as (fig, ax):
+        ax.plot(X, k / X)
+        ax.set_title(f"y = {k}/x")
+        ax.grid(True)
+        if png:
+            return fig_to_png(fig, dpi=50)
+
+
+# 재실행 10,000번 동안 pyplot에 그림이 쌓이지 않고, 객체 수와 프로세스 메모리가 늘지 않아야 함
+def test_memory_flat_over_many_reruns():
+    for i in range(100):  # 글꼴 등록, 캐시 등 처음 한 번 드는 비용은 빼고 잼
+        rerun(i)
+    gc.collect()
+    objects = len(gc.get_objects())
+    peak_rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    for i in range(RERUNS):
+        rerun(i % 200 / 10)
+
+    gc.collect()
+    assert plt.get_fignums() == []
+    assert len(gc.get_objects()) - objects < 1000
+    # 그림 하나만 남아도 1만 번이면 수백 MB → 여유를 두고 32MB
+    assert resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - peak_rss_kb < 32 * 1024
+
+
+# PNG까지 만드는 재실행: tracemalloc으로 본 최대 메모리와 남는 메모리가 일정해야 함
+def test_tracemalloc_bounded_with_png_output():
+    for i in range(10):
+        rerun(i, png=True)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        base = tracemalloc.get_traced_memory()[0]
+        peaks = []
+        for i in range(100):
+            tracemalloc.reset_peak()
+            rerun(i / 10, png=True)
+            peaks.append(tracemalloc.get_traced_memory()[1] - base)
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0] - base
+    finally:
+        tracemalloc.stop()
+    assert plt.get_fignums() == []
+    assert retained < 512 * 1024
+    # 뒤쪽 재실행의 최대 메모리가 앞쪽보다 커지지 않아야 함 (쌓이면 계속 커짐)
+    assert max(peaks[50:]) < max(peaks[:50]) * 1.2
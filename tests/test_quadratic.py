@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+from quadratic import vertex_form, visible_segments
+
+X_RANGE, Y_RANGE = (-10.0, 10.0), (-10.0, 10.0)
+
+
+# 모든 점이 곡선 위, 창 안에 있음
+@pytest.mark.parametrize("a, p, q", [(1.0, 0.0, 0.0), (-0.5, 3.0, 4.0), (20.0, -2.0, -5.0)])
+def test_segments_lie_on_curve_inside_window(a, p, q):
+    segments, owner = visible_segments([a], p, q, X_RANGE, Y_RANGE, n=50)
+    assert segments.shape[1:] == (50, 2) and (owner == 0).all()
+    x, y = segments[..., 0], segments[..., 1]
+    assert np.allclose(y, vertex_form(x, a, p, q))
+    assert (x >= -10).all() and (x <= 10).all() and (y >= -10).all() and (y <= 10).all()
+
+
+# 곡선이 열린 쪽으로 꼭짓점이 창 밖에 있으면 양쪽 두 구간, 반대쪽이면 구간 없음
+def test_vertex_position_decides_segment_count():
+    segments, owner = visible_segments([1.0, 1.0, -1.0, -1.0], 0.0, [-20.0, 30.0, -20.0, 30.0],
+                                       X_RANGE, Y_RANGE)
+    assert sorted(owner.tolist()) == [0, 0, 3, 3]
+    for curve in (0, 3):
+        left, right = segments[owner == curve]
+        assert left[:, 0].max() < 0 < right[:, 0].min()
+
+
+# a = 0 이면 직선 y = q: 창 안이면 x 전체 구간 하나, 밖이면 없음
+def test_flat_line():
+    segments, owner = visible_segments([0.0, 0.0], 0.0, [3.0, 11.0], X_RANGE, Y_RANGE, n=5)
+    assert owner.tolist() == [0]
+    assert np.allclose(segments[0], [[-10, 3], [-5, 3], [0, 3], [5, 3], [10, 3]])
@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+
+from sampling import sample_function, sample_rational
+
+
+# 선분 (x[i], x[i+1])이 NaN 없이 x = 0을 가로지르면 점근선 위로 세로선이 그려진 것
+def crosses_zero(x, y):
+    ok = ~np.isnan(y[:-1]) & ~np.isnan(y[1:])
+    return bool(np.any(ok & (x[:-1] < 0) & (x[1:] > 0)))
+
+
+# |k|가 작고 x 범위가 넓으면 x = 0 양옆 표본점이 모두 창 안에 들어와도 끊겨야 함
+@pytest.mark.parametrize("k, r", [(0.1, 50), (0.5, 50), (0.2, 30), (-0.01, 50), (2.0, 10), (10.0, 5)])
+def test_rational_breaks_at_asymptote(k, r):
+    x, y = sample_rational(k, -r, r, -r, r)
+    assert np.isnan(y).sum() == 1
+    assert not crosses_zero(x, y)
+    # 두 가지 모두 창 경계까지 이어짐
+    assert np.nanmax(np.abs(y)) == pytest.approx(r, rel=1e-3)
+
+
+# 0을 지나는 연속 함수(가파른 직선)는 끊지 않음
+def test_continuous_sign_change_is_not_cut():
+    x, y = sample_function(lambda x: 50 * x, -10, 10, -100, 100)
+    assert not np.isnan(y).any()
@@ -0,0 +1,32 @@
+import numpy as np
+
+from viewport import MAX_LEVEL, make_tile_cache, move_view, sample_view, view_window
+
+BASE = (10.0, 8.0)
+
+
+# 확대하면 창이 절반으로 줄고 가운데를 유지, 이동은 창의 절반씩
+def test_view_window_and_moves():
+    assert view_window(BASE, (0, 0, 0)) == ((-10.0, 10.0), (-8.0, 8.0))
+    view = move_view((0, 0, 0), "in")
+    assert view_window(BASE, view) == ((-5.0, 5.0), (-4.0, 4.0))
+    view = move_view(move_view(view, "right"), "up")
+    assert view_window(BASE, view) == ((0.0, 10.0), (0.0, 8.0))
+    assert move_view(view, "out") == (0, 0, 0)
+    assert move_view(view, "reset") == (0, 0, 0)
+    assert move_view((MAX_LEVEL, 3, 1), "in") == (MAX_LEVEL, 3, 1)
+    assert move_view((0, 0, 0), "out") == (0, 0, 0)
+
+
+# 창 안의 점은 함수 위에 있고, 옆으로 한 칸 옮기면 겹치는 타일 두 개는 캐시에서 나옴
+def test_sample_view_reuses_tiles():
+    cache = make_tile_cache()
+    f = lambda x: 2.0 / x
+    x, y = sample_view(cache, ("k/x", 2.0), f, BASE, (1, 0, 0), 200)
+    ok = ~np.isnan(y)
+    assert np.allclose(y[ok], f(x[ok]))
+    assert x[ok].min() >= -5 and x[ok].max() <= 5
+    assert cache.stats()["misses"] == 4
+    sample_view(cache, ("k/x", 2.0), f, BASE, (1, 1, 0), 200)
+    stats = cache.stats()
+    assert stats["hits"] == 2 and stats["misses"] == 6
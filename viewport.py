@@ -0,0 +1,86 @@
+# 그래프 확대/이동(줌·팬) 보기
+# 확대 단계 L의 창은 기본 창의 1/2^L 크기이고, 항상 가로 2 × 세로 2 타일로 이루어집니다.
+# 타일마다 화면 픽셀 수에 맞춘 개수의 점으로 함수를 다시 표본화해서 캐시하므로
+# 깊게 확대해도 선이 거칠어지지 않고, 이동은 타일 한 칸(창의 절반)씩이라 절반은 캐시에서 바로 나옵니다.
+import numpy as np
+import streamlit as st
+
+from plot_utils import FigureCache
+from sampling import sample_function
+
+MAX_LEVEL = 16  # 최대 2^16 = 65536배
+
+# 7인치 × 200dpi 그림에서 축 영역의 가로 픽셀 수 (대략) — 확대 보기는 이만큼의 점으로 다시 표본화
+VIEW_PIXELS = 1100
+
+
+def make_tile_cache(max_items=1024):
+    return FigureCache(max_items=max_items, max_bytes=32 * 1024 * 1024,
+                       sizeof=lambda tile: tile[0].nbytes + tile[1].nbytes)
+
+
+# 기본 창의 (가로 반폭, 세로 반높이)와 보기 상태 (단계, 가로 타일, 세로 타일) → 창의 x, y 범위
+def view_window(base, view):
+    level, cx, cy = view
+    w, h = base[0] / 2**level, base[1] / 2**level
+    return (cx * w - w, cx * w + w), (cy * h - h, cy * h + h)
+
+
+def move_view(view, action):
+    level, cx, cy = view
+    if action == "in" and level < MAX_LEVEL:
+        return level + 1, cx * 2, cy * 2
+    if action == "out" and level > 0:
+        return level - 1, int(cx / 2), int(cy / 2)
+    steps = {"left": (-1, 0), "right": (1, 0), "up": (0, 1), "down": (0, -1)}
+    if action in steps:
+        dx, dy = steps[action]
+        return level, cx + dx, cy + dy
+    if action == "reset":
+        return 0, 0, 0
+    return view
+
+
+def sample_view(cache, key, f, base, view, pixels):
+    """창을 이루는 2×2 타일을 (캐시에서 꺼내거나 새로 표본화해서) 이어 붙인 (x, y)를 돌려줍니다.
+
+    key는 함수를 구분하는 값(예: ("k/x", k)), pixels는 창의 가로 픽셀 수입니다.
+    타일 사이와 점근선 자리에는 NaN을 넣어 선을 끊습니다.
+    """
+    level, cx, cy = view
+    w, h = base[0] / 2**level, base[1] / 2**level
+    xs, ys = [], []
+    for ix in (cx - 1, cx):
+        for iy in (cy - 1, cy):
+            tile_key = (key, base, level, ix, iy, pixels)
+            tx, ty = cache.get_or_render(tile_key, lambda: sample_function(
+                f, ix * w, (ix + 1) * w, iy * h, (iy + 1) * h, n=max(2, pixels // 2)))
+            if len(tx):
+                xs += [tx, [tx[-1]]]
+                ys += [ty, [np.nan]]
+    if not xs:
+        return np.empty(0), np.empty(0)
+    return np.concatenate(xs), np.concatenate(ys)
+
+
+# 확대/축소/이동 버튼 (st.session_state[key]에 보기 상태를 저장하고 돌려줌)
+# follow를 주면 확대·축소·좌우 이동 뒤에 창을 위아래로 옮겨 곡선 y = follow(가운데 x)를 따라감
+def view_controls(key, base, follow=None):
+    st.session_state.setdefault(key, (0, 0, 0))
+
+    def on_click(action):
+        level, cx, cy = move_view(st.session_state[key], action)
+        if follow is not None and action in ("in", "out", "left", "right"):
+            w, h = base[0] / 2**level, base[1] / 2**level
+            with np.errstate(divide="ignore", invalid="ignore"):
+                y = float(follow(np.float64(cx * w)))
+            if np.isfinite(y):
+                cy = round(y / h)
+        st.session_state[key] = (level, cx, cy)
+
+    buttons = [("➕", "in"), ("➖", "out"), ("⬅️", "left"), ("➡️", "right"),
+               ("⬆️", "up"), ("⬇️", "down"), ("↺", "reset")]
+    for col, (label, action) in zip(st.columns(len(buttons)), buttons):
+        col.button(label, key=f"{key}-{action}", on_click=on_click, args=(action,),
+                   width="stretch")
+    return st.session_state[key]
@@ -0,0 +1,137 @@
+# 서버 준비(워밍업)와 페이지별 import 시간 측정
+# numpy / pandas / matplotlib 같은 무거운 모듈은 처음 import 할 때만 오래 걸리고, 한 번 불러오면
+# 서버 프로세스 안의 모든 세션·페이지가 같은 모듈을 씁니다. 첫 방문자가 이 시간을 기다리지 않도록
+# 미리 불러 두는 방법 두 가지를 제공합니다.
+# (필요할 때까지 import를 미루는 것은 matplotlib뿐입니다. numpy와 pandas는 페이지와 도우미 모듈
+#  맨 위에서 바로 불러오므로, 워밍업은 이 둘을 첫 방문 전에 미리 불러 두는 역할만 합니다.)
+#
+#   python warmup.py run main.py [streamlit 옵션...]   서버를 띄우기 전에 같은 프로세스에서 미리 import
+#   (main.py의 start_warm_up())                        첫 방문 때 백그라운드 스레드에서 미리 import
+#   python warmup.py report                            페이지별 import 시간 (새 인터프리터 기준) 출력
+import ast
+import glob
+import importlib
+import os
+import subprocess
+import sys
+import threading
+import time
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 미리 불러 둘 모듈 (pyarrow는 설치된 경우에만)
+HEAVY_MODULES = [
+    "numpy",
+    "pandas",
+    "matplotlib",
+    "matplotlib.figure",
+    "matplotlib.backends.backend_agg",
+    "matplotlib.collections",
+    "pyarrow",
+    "pyarrow.parquet",
+]
+
+TIMINGS = {}  # 모듈 이름 → import에 걸린 초 (이미 불러온 모듈은 0에 가까움)
+
+_lock = threading.Lock()
+_thread = None
+
+
+def warm_up():
+    """무거운 모듈을 import 하고 matplotlib(Agg 백엔드, 한글 글꼴)을 준비합니다. 걸린 시간(초)을 돌려줍니다."""
+    started = time.perf_counter()
+    for name in HEAVY_MODULES:
+        t = time.perf_counter()
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            continue
+        TIMINGS[name] = time.perf_counter() - t
+
+    import matplotlib
+
+    # 화면 없는 서버에서 쓰는 백엔드로 고정 (pyplot을 쓰더라도 GUI 백엔드를 찾지 않음)
+    matplotlib.use("Agg")
+    t = time.perf_counter()
+    from korean_font import setup_korean_font
+
+    setup_korean_font()
+    TIMINGS["korean_font"] = time.perf_counter() - t
+    return time.perf_counter() - started
+
+
+# 백그라운드 스레드에서 warm_up()을 (프로세스마다 한 번만) 시작
+def start_warm_up():
+    global _thread
+    with _lock:
+        if _thread is None:
+            _thread = threading.Thread(target=warm_up, name="warm-up", daemon=True)
+            _thread.start()
+        return _thread
+
+
+# 페이지 파일 맨 위의 import 문만 뽑아냄
+def page_imports(path):
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+    nodes = [node for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom))]
+    return "\n".join(ast.unparse(node) for node in nodes)
+
+
+def measure_imports(path, warm=False, preload=()):
+    """새 파이썬 프로세스에서 페이지의 import 문만 실행하고 걸린 시간(초)을 돌려줍니다.
+
+    streamlit은 서버에 이미 올라와 있으므로 측정 전에 불러 둡니다.
+    preload의 모듈은 측정 전에 불러 둡니다 (예: numpy, pandas를 빼고 페이지 자신의 몫만 보기).
+    warm=True면 warm_up()을 먼저 실행한 뒤에 잽니다 (미리 불러 둔 경우의 시간).
+    """
+    code = "\n".join([
+        "import sys, time",
+        f"sys.path.insert(0, {BASE_DIR!r})",
+        "import streamlit",
+        *(f"import {name}" for name in preload),
+        "import warmup; warmup.warm_up()" if warm else "",
+        "t = time.perf_counter()",
+        page_imports(path),
+        "print(time.perf_counter() - t)",
+    ])
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                         check=True, cwd=BASE_DIR)
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def report():
+    pages = [os.path.join(BASE_DIR, "main.py")] + sorted(glob.glob(os.path.join(BASE_DIR, "pages", "*.py")))
+    # 처음 import 시간 중 numpy·pandas 몫은 두 번째 열과의 차이로 보임
+    print(f"{'페이지':<24} {'처음 import':>12} {'numpy·pandas 제외':>18} {'워밍업 후':>10}")
+    for path in pages:
+        cold = measure_imports(path)
+        own = measure_imports(path, preload=("numpy", "pandas"))
+        warm = measure_imports(path, warm=True)
+        print(f"{os.path.relpath(path, BASE_DIR):<24} {cold * 1000:>10.0f}ms {own * 1000:>16.0f}ms "
+              f"{warm * 1000:>8.0f}ms")
+    started = time.perf_counter()
+    warm_up()
+    print(f"\n워밍업 전체: {(time.perf_counter() - started) * 1000:.0f}ms")
+    for name, seconds in TIMINGS.items():
+        print(f"  {name:<34} {seconds * 1000:>6.0f}ms")
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["report"]:
+        report()
+        return 0
+    if argv[:1] == ["run"] and len(argv) > 1:
+        seconds = warm_up()
+        print(f"워밍업 완료 ({seconds * 1000:.0f}ms)", file=sys.stderr)
+        from streamlit.web import cli
+
+        sys.argv = ["streamlit", *argv]
+        return cli.main()
+    print("사용법: python warmup.py run main.py [streamlit 옵션...] | python warmup.py report", file=sys.stderr)
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())